@@ -4,17 +4,58 @@ Basic usage example for pCloud SDK Python
 Demonstrates the most common operations
 """
 
+import argparse
 import os
 import sys
 import tempfile
 
+import requests
+from requests.adapters import HTTPAdapter
+
 # Import pCloud SDK
 from pcloud_sdk import PCloudSDK
 from pcloud_sdk.progress_utils import create_progress_bar
 
 
-def main():
+def parse_args(argv=None):
+    """Command line options (default to PCLOUD_EMAIL / PCLOUD_PASSWORD)"""
+    parser = argparse.ArgumentParser(description="pCloud SDK basic usage")
+    parser.add_argument("--email", default=os.environ.get("PCLOUD_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("PCLOUD_PASSWORD"))
+    return parser.parse_args(argv)
+
+
+def cleanup(pcloud, folder_id, file_id, created_folder):
+    """Remove what the demo uploaded, never a folder it did not create"""
+    if created_folder:
+        # One recursive call removes our own test folder and its file
+        try:
+            pcloud.folder.delete_recursive(folder_id)
+            print("✅ Test folder and file deleted")
+        except Exception as e:
+            print(f"⚠️ Folder deletion error: {e}")
+        return
+
+    if file_id:
+        try:
+            pcloud.file.delete(file_id)
+            print("✅ Test file deleted")
+        except Exception as e:
+            print(f"⚠️ File deletion error: {e}")
+
+    # A pre-existing folder: the non-recursive delete refuses it if it
+    # still holds the user's data
+    if folder_id and folder_id != 0:
+        try:
+            pcloud.folder.delete(folder_id)
+            print("✅ Test folder deleted")
+        except Exception as e:
+            print(f"⚠️ Folder deletion error: {e}")
+
+
+def main(argv=None):
     """Basic usage example for pCloud SDK"""
+    args = parse_args(argv)
 
     print("🚀 pCloud SDK Python - Basic Usage Example")
     print("=" * 50)
@@ -22,26 +63,33 @@ def main():
     # 1. Configuration and authentication
     print("\n1️⃣ Authentication...")
 
-    # Option A: Use environment variables
-    email = os.environ.get("PCLOUD_EMAIL")
-    password = os.environ.get("PCLOUD_PASSWORD")
+    # Option A: Use command line options or environment variables
+    email = args.email
+    password = args.password
 
-    pcloud = PCloudSDK()
+    # Share one keep-alive session across all API calls
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+    pcloud = PCloudSDK(session=session)
 
     if email and password:
         print(f"📧 Connecting with email: {email}")
         pcloud.login(email, password)
     else:
-        # Option B: Manual input (for demo)
+        # Option B: Manual input (for demo, only when a terminal is attached)
         print("📧 Environment variables not found")
-        print("💡 Tip: set PCLOUD_EMAIL and PCLOUD_PASSWORD")
+        print("💡 Tip: set PCLOUD_EMAIL and PCLOUD_PASSWORD or use --email/--password")
 
-        email = input("pCloud Email: ").strip()
-        password = input("Password: ").strip()
+        if sys.stdin.isatty():
+            email = input("pCloud Email: ").strip()
+            password = input("Password: ").strip()
 
         if not email or not password:
             print("❌ Email and password required")
-            return
+            session.close()
+            return 1
 
         pcloud.login(email, password)
 
@@ -51,16 +99,17 @@ def main():
         user_info = pcloud.user.get_user_info()
 
         print(f"👤 User: {user_info.get('email', 'N/A')}")
-        print(f"💾 Quota: {user_info.get('quota', 0) // (1024**3):.1f} GB")
-        print(f"📁 Used: {user_info.get('usedquota', 0) // (1024**3):.1f} GB")
+        print(f"💾 Quota: {user_info.get('quota', 0) >> 30:.1f} GB")
+        print(f"📁 Used: {user_info.get('usedquota', 0) >> 30:.1f} GB")
 
         # 3. List root folder contents
         print("\n3️⃣ Root folder contents...")
         root_content = pcloud.folder.list_root()
 
         folders = root_content.get("contents", [])
-        print(f"📂 {len([f for f in folders if f.get('isfolder')])} folders")
-        print(f"📄 {len([f for f in folders if not f.get('isfolder')])} files")
+        folder_count = sum(1 for f in folders if f.get("isfolder"))
+        print(f"📂 {folder_count} folders")
+        print(f"📄 {len(folders) - folder_count} files")
 
         # Display some items
         for item in folders[:5]:  # First 5 items
@@ -80,119 +129,97 @@ def main():
         print("\n4️⃣ Creating test folder...")
         test_folder_name = "SDK_Test_Folder"
 
+        # Only a folder this run created may be deleted recursively
+        created_folder = False
         try:
             folder_id = pcloud.folder.create(test_folder_name, parent=0)
+            created_folder = True
             print(f"✅ Folder created: {test_folder_name} (ID: {folder_id})")
         except Exception as e:
             print(f"⚠️ Folder already exists or error: {e}")
             # Try to find it
-            for item in folders:
-                if item.get("name") == test_folder_name and item.get("isfolder"):
-                    folder_id = item.get("folderid")
-                    print(f"📁 Using existing folder (ID: {folder_id})")
-                    break
+            existing = next(
+                (
+                    f
+                    for f in folders
+                    if f.get("isfolder") and f.get("name") == test_folder_name
+                ),
+                None,
+            )
+            if existing:
+                folder_id = existing.get("folderid")
+                print(f"📁 Using existing folder (ID: {folder_id})")
             else:
                 folder_id = 0  # Use root folder as fallback
 
         # 5. Upload a test file
         print("\n5️⃣ Uploading test file...")
 
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as tmp_file:
+        # Temporary directory removes the test file however the upload ends
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_file_path = os.path.join(tmp_dir, "test_sdk.txt")
             test_content = f"""pCloud SDK Test File
 Created on: {__import__('datetime').datetime.now()}
 Content: This is a test upload from the pCloud Python SDK
 Size: About 200 characters to test upload functionality
 """
-            tmp_file.write(test_content)
-            tmp_file_path = tmp_file.name
+            with open(tmp_file_path, "w") as tmp_file:
+                tmp_file.write(test_content)
 
-        # Upload with progress bar
-        progress_bar = create_progress_bar("Upload Test")
+            # Upload with progress bar
+            progress_bar = create_progress_bar("Upload Test")
 
-        try:
-            upload_result = pcloud.file.upload(
-                tmp_file_path,
-                folder_id=folder_id,
-                filename="test_sdk.txt",
-                progress_callback=progress_bar,
-            )
-
-            file_id = upload_result["metadata"]["fileid"]
-            file_name = upload_result["metadata"]["name"]
-            print(f"✅ File uploaded: {file_name} (ID: {file_id})")
+            try:
+                upload_result = pcloud.file.upload(
+                    tmp_file_path,
+                    folder_id=folder_id,
+                    filename="test_sdk.txt",
+                    progress_callback=progress_bar,
+                )
 
-        except Exception as e:
-            print(f"❌ Upload error: {e}")
-            file_id = None
+                file_id = upload_result["metadata"]["fileid"]
+                file_name = upload_result["metadata"]["name"]
+                print(f"✅ File uploaded: {file_name} (ID: {file_id})")
 
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(tmp_file_path)
-            except OSError:
-                pass
+            except Exception as e:
+                print(f"❌ Upload error: {e}")
+                file_id = None
 
         # 6. Download the file
         if file_id:
             print("\n6️⃣ Downloading file...")
 
-            download_dir = tempfile.mkdtemp()
             progress_bar_dl = create_progress_bar("Download Test")
 
             try:
-                success = pcloud.file.download(
-                    file_id, destination=download_dir, progress_callback=progress_bar_dl
-                )
-
-                if success:
-                    downloaded_files = os.listdir(download_dir)
-                    if downloaded_files:
-                        downloaded_file = os.path.join(
-                            download_dir, downloaded_files[0]
-                        )
-                        file_size = os.path.getsize(downloaded_file)
-                        print(
-                            f"✅ File downloaded: "
-                            f"{downloaded_files[0]} "
-                            f"({file_size} bytes)"
-                        )
-
-                        # Verify content
-                        with open(downloaded_file, "r") as f:
-                            content = f.read()
-                            if "pCloud SDK" in content:
-                                print("✅ Content verified - download successful!")
+                with tempfile.TemporaryDirectory() as download_dir:
+                    success = pcloud.file.download(
+                        file_id,
+                        destination=download_dir,
+                        progress_callback=progress_bar_dl,
+                    )
+
+                    if success:
+                        with os.scandir(download_dir) as entries:
+                            entry = next(entries, None)
+                        if entry is not None:
+                            downloaded_file = entry.path
+                            file_size = entry.stat().st_size
+                            print(
+                                f"✅ File downloaded: {entry.name} ({file_size} bytes)"
+                            )
+
+                            # Verify content (byte scan, no text decoding needed)
+                            with open(downloaded_file, "rb") as f:
+                                if b"pCloud SDK" in f.read():
+                                    print("✅ Content verified - download successful!")
 
             except Exception as e:
                 print(f"❌ Download error: {e}")
 
-            finally:
-                # Clean up download directory
-                try:
-                    import shutil
-
-                    shutil.rmtree(download_dir)
-                except OSError:
-                    pass
-
-            # 7. Delete test file
-            print("\n7️⃣ Cleanup...")
-            try:
-                pcloud.file.delete(file_id)
-                print("✅ Test file deleted")
-            except Exception as e:
-                print(f"⚠️ File deletion error: {e}")
-
-        # 8. Delete test folder
-        if folder_id and folder_id != 0:
-            try:
-                pcloud.folder.delete(folder_id)
-                print("✅ Test folder deleted")
-            except Exception as e:
-                print(f"⚠️ Folder deletion error: {e}")
+        # 7-8. Cleanup
+        print("\n7️⃣ Cleanup...")
+        cleanup(pcloud, folder_id, file_id, created_folder)
 
         print("\n🎉 Basic test completed successfully!")
         print("\n💡 What you can do now:")
@@ -205,6 +232,9 @@ Size: About 200 characters to test upload functionality
         print("💡 Check your credentials and internet connection")
         return 1
 
+    finally:
+        session.close()
+
     return 0
 
 
@@ -15,35 +15,67 @@ This comprehensive example demonstrates all major features of the pCloud SDK:
 Run this script to see the SDK in action!
 """
 
+import argparse
 import hashlib
 import os
+import sys
 import tempfile
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from pcloud_sdk import PCloudException, PCloudSDK
 from pcloud_sdk.progress_utils import create_detailed_progress, create_progress_bar
 
+HASH_BUFFER_SIZE = 1024 * 1024  # 1MB read buffer for hashing
+
 
 def create_test_file(filename: str, size_mb: int = 5) -> str:
     """Create a test file for upload demonstration"""
-    content = "This is a test file created by pCloud SDK demo.\n" * (
-        size_mb * 1024 * 20
-    )
+    # Write a pre-encoded block repeatedly so memory stays bounded by the block
+    block = b"This is a test file created by pCloud SDK demo.\n" * 1024
 
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
+    with open(filename, "wb", buffering=1024 * 1024) as f:
+        for _ in range(size_mb * 20):
+            f.write(block)
 
     return filename
 
 
+def _new_file_hash() -> Any:
+    """Hash object used for local integrity checks"""
+    return hashlib.blake2b(digest_size=16)
+
+
 def calculate_file_hash(filepath: str) -> str:
-    """Calculate MD5 hash of a file for verification"""
-    hash_md5 = hashlib.md5()
-    with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    """Calculate a BLAKE2b (128-bit) hash of a file for verification
+
+    Only used to compare local copies, so a fast non-cryptographic-purpose
+    digest is enough and, unlike MD5, it still works on FIPS builds.
+    """
+    with open(filepath, "rb", buffering=HASH_BUFFER_SIZE) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, _new_file_hash).hexdigest()
+
+        # Older Pythons: reuse one 1MB buffer instead of new bytes per chunk
+        file_hash = _new_file_hash()
+        buffer = memoryview(bytearray(HASH_BUFFER_SIZE))
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            file_hash.update(buffer[:read])
+    return file_hash.hexdigest()
+
+
+def prompt(message: str) -> str:
+    """Ask the user for a value, or return "" when no terminal is attached"""
+    if not sys.stdin.isatty():
+        return ""
+    return input(message).strip()
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -58,21 +90,50 @@ def format_bytes(bytes_value: int) -> str:
 class PCloudDemo:
     """Complete pCloud SDK demonstration class"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        auth: Optional[str] = None,
+    ):
+        self.email = email
+        self.password = password
+        self.auth = auth
         self.sdk: Optional[PCloudSDK] = None
+        self.session: Optional[requests.Session] = None
         self.demo_folder_id: Optional[int] = None
-        self.temp_files = []
+        # Local test files live here; removed in one go by cleanup()
+        self.temp_dir = tempfile.TemporaryDirectory(prefix="pcloud_demo_")
+        self.original_file: Optional[str] = None
+        # Folder listings by folder ID, dropped when the folder tree changes
+        self._folder_contents: Dict[int, List[Dict[str, Any]]] = {}
+
+    def get_folder_contents(self, folder_id: int) -> List[Dict[str, Any]]:
+        """List a folder once and reuse the result until it is invalidated"""
+        if folder_id not in self._folder_contents:
+            self._folder_contents[folder_id] = self.sdk.folder.get_content(folder_id)
+        return self._folder_contents[folder_id]
+
+    def invalidate_folder_contents(self, folder_id: int) -> None:
+        """Forget a cached listing after creating or removing subfolders"""
+        self._folder_contents.pop(folder_id, None)
 
     def setup_sdk(self):
         """Initialize and authenticate with pCloud SDK"""
         print("🚀 pCloud SDK Complete Demo")
         print("=" * 50)
 
+        # One keep-alive session shared by every API call of the demo
+        self.session = requests.Session()
+        self.session.headers.update({"Connection": "keep-alive"})
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
         # Initialize SDK with automatic token management
         self.sdk = PCloudSDK(
             location_id=2,  # EU server
             token_manager=True,
             token_file=".pcloud_demo_credentials",
+            session=self.session,
         )
 
         # Check if we have saved credentials
@@ -97,13 +158,22 @@ class PCloudDemo:
                     f"credentials: {e}"
                 )
 
+        if self.auth == "saved":
+            print("❌ No valid saved credentials")
+            return False
+
         # Need fresh authentication
-        print("\n🔐 Authentication Required")
-        print("Choose authentication method:")
-        print("1. Email/Password (Direct)")
-        print("2. OAuth2 Flow")
+        if self.auth:
+            choice = "2" if self.auth == "oauth2" else "1"
+        elif self.email and self.password:
+            choice = "1"
+        else:
+            print("\n🔐 Authentication Required")
+            print("Choose authentication method:")
+            print("1. Email/Password (Direct)")
+            print("2. OAuth2 Flow")
 
-        choice = input("Enter choice (1 or 2): ").strip()
+            choice = prompt("Enter choice (1 or 2): ")
 
         if choice == "1":
             return self._authenticate_direct()
@@ -116,15 +186,17 @@ class PCloudDemo:
     def _authenticate_direct(self) -> bool:
         """Direct email/password authentication"""
         try:
-            email = input("📧 Enter your pCloud email: ").strip()
-            password = input("🔒 Enter your password: ").strip()
+            email = self.email or prompt("📧 Enter your pCloud email: ")
+            password = self.password or prompt("🔒 Enter your password: ")
 
             if not email or not password:
                 print("❌ Email and password are required")
                 return False
 
             print("🔄 Authenticating...")
-            self.sdk.login(email, password)
+            # Saved token was already probed in setup_sdk(), don't test it again.
+            # The token manager writes the new token back to the credentials file.
+            self.sdk.login(email, password, force_login=True)
 
             user_info = self.sdk.user.get_user_info()
             print(f"✅ Successfully logged in as: {user_info.get('email')}")
@@ -154,9 +226,7 @@ class PCloudDemo:
             print()
 
             # Get authorization code from user
-            code = input(
-                "📋 Enter the authorization code from the callback URL: "
-            ).strip()
+            code = prompt("📋 Enter the authorization code from the callback URL: ")
 
             if not code:
                 print("❌ Authorization code is required")
@@ -232,10 +302,11 @@ class PCloudDemo:
                 "Subfolder_Test", parent=self.demo_folder_id
             )
             print(f"✅ Subfolder created with ID: {subfolder_id}")
+            self.invalidate_folder_contents(self.demo_folder_id)
 
             # List demo folder contents
             print("\n📋 Demo folder contents:")
-            demo_contents = self.sdk.folder.get_content(self.demo_folder_id)
+            demo_contents = self.get_folder_contents(self.demo_folder_id)
 
             if demo_contents:
                 for item in demo_contents:
@@ -254,54 +325,46 @@ class PCloudDemo:
         print("\n📤 File Upload Demo")
         print("-" * 30)
 
-        # Create test files
-        test_files = []
-        temp_dir = tempfile.gettempdir()
-
         try:
             # Create different sized test files
-            small_file = os.path.join(temp_dir, "small_test.txt")
-            medium_file = os.path.join(temp_dir, "medium_test.txt")
+            small_file = os.path.join(self.temp_dir.name, "small_test.txt")
+            medium_file = os.path.join(self.temp_dir.name, "medium_test.txt")
 
             create_test_file(small_file, 1)  # 1MB
             create_test_file(medium_file, 5)  # 5MB
+            self.original_file = small_file
+
+            # Upload both files concurrently; the shared session pool gives
+            # each worker its own connection
+            print("1️⃣ Upload with Simple Progress Bar (small file)")
+            print("2️⃣ Upload with Detailed Progress (medium file)")
+            # Open handles are streamed by the SDK without reopening the files
+            with open(small_file, "rb") as small_fh, open(
+                medium_file, "rb"
+            ) as medium_fh, ThreadPoolExecutor(max_workers=2) as executor:
+                small_future = executor.submit(
+                    self.sdk.file.upload,
+                    small_fh,
+                    folder_id=self.demo_folder_id,
+                    progress_callback=create_progress_bar("Small File Upload"),
+                )
+                medium_future = executor.submit(
+                    self.sdk.file.upload,
+                    medium_fh,
+                    folder_id=self.demo_folder_id,
+                    progress_callback=create_detailed_progress(),
+                )
+                small_file_id = small_future.result()["metadata"][0]["fileid"]
+                medium_file_id = medium_future.result()["metadata"][0]["fileid"]
 
-            test_files.extend([small_file, medium_file])
-            self.temp_files.extend(test_files)
-
-            # Upload with simple progress bar
-            print("1️⃣ Upload with Simple Progress Bar:")
-            progress_bar = create_progress_bar("Small File Upload")
-
-            result = self.sdk.file.upload(
-                small_file,
-                folder_id=self.demo_folder_id,
-                progress_callback=progress_bar,
-            )
-            small_file_id = result["metadata"][0]["fileid"]
-            print(f"   File ID: {small_file_id}")
-
-            # Upload with detailed progress
-            print("\n2️⃣ Upload with Detailed Progress:")
-            detailed_progress = create_detailed_progress()
-
-            result = self.sdk.file.upload(
-                medium_file,
-                folder_id=self.demo_folder_id,
-                progress_callback=detailed_progress,
-            )
-            medium_file_id = result["metadata"][0]["fileid"]
-            print(f"   File ID: {medium_file_id}")
+            print(f"   Small file ID: {small_file_id}")
+            print(f"   Medium file ID: {medium_file_id}")
 
             # Store file IDs for later operations
             self.uploaded_file_ids = [small_file_id, medium_file_id]
 
         except Exception as e:
             print(f"❌ Error in file upload: {e}")
-            # Cleanup temp files
-            for f in test_files:
-                if os.path.exists(f):
-                    os.remove(f)
 
     def demonstrate_file_download(self):
         """Demonstrate file download with verification"""
@@ -312,51 +375,43 @@ class PCloudDemo:
             print("⚠️ No uploaded files to download")
             return
 
-        temp_dir = tempfile.gettempdir()
-        download_dir = os.path.join(temp_dir, "pcloud_downloads")
-
         try:
-            # Create download directory
-            os.makedirs(download_dir, exist_ok=True)
-
-            # Download first file with progress
-            file_id = self.uploaded_file_ids[0]
-            print(f"📥 Downloading file ID {file_id}...")
-
-            progress_bar = create_progress_bar("Download Progress")
-
-            success = self.sdk.file.download(
-                file_id, destination=download_dir, progress_callback=progress_bar
-            )
-
-            if success:
-                # List downloaded files
-                downloaded_files = os.listdir(download_dir)
-                print(f"✅ Downloaded files: {downloaded_files}")
+            # Download directory is removed with its contents on exit
+            with tempfile.TemporaryDirectory(
+                prefix="pcloud_downloads_"
+            ) as download_dir:
+                # Download first file with progress
+                file_id = self.uploaded_file_ids[0]
+                print(f"📥 Downloading file ID {file_id}...")
+
+                progress_bar = create_progress_bar("Download Progress")
+
+                # Hash the bytes as they arrive instead of re-reading the file
+                download_hash = _new_file_hash()
+                success = self.sdk.file.download(
+                    file_id,
+                    destination=download_dir,
+                    progress_callback=progress_bar,
+                    chunk_callback=download_hash.update,
+                )
 
-                # Verify file integrity (if we have original)
-                if self.temp_files:
-                    original_file = self.temp_files[0]
-                    downloaded_file = os.path.join(
-                        download_dir, os.path.basename(original_file)
-                    )
+                if success:
+                    # List downloaded files
+                    with os.scandir(download_dir) as entries:
+                        downloaded_files = [entry.name for entry in entries]
+                    print(f"✅ Downloaded files: {downloaded_files}")
 
-                    if os.path.exists(downloaded_file):
-                        original_hash = calculate_file_hash(original_file)
-                        downloaded_hash = calculate_file_hash(downloaded_file)
+                    # Verify file integrity (if we have original)
+                    if self.original_file:
+                        original_hash = calculate_file_hash(self.original_file)
 
-                        if original_hash == downloaded_hash:
+                        if original_hash == download_hash.hexdigest():
                             print("✅ File integrity verified - checksums match!")
                         else:
                             print(
                                 "⚠️ File integrity check failed - checksums don't match"
                             )
 
-            # Cleanup downloaded files
-            for f in os.listdir(download_dir):
-                os.remove(os.path.join(download_dir, f))
-            os.rmdir(download_dir)
-
         except Exception as e:
             print(f"❌ Error in file download: {e}")
 
@@ -391,8 +446,10 @@ class PCloudDemo:
             copied_file_id = copy_result["metadata"]["fileid"]
             print(f"✅ File copied successfully (new ID: {copied_file_id})")
 
-            # Move copied file to subfolder (if exists)
-            demo_contents = self.sdk.folder.get_content(self.demo_folder_id)
+            # Move copied file to subfolder (if exists). Only subfolders are
+            # looked up, and file uploads/copies don't change them, so the
+            # listing cached by demonstrate_folder_operations() is still valid
+            demo_contents = self.get_folder_contents(self.demo_folder_id)
             subfolder = next(
                 (item for item in demo_contents if item.get("isfolder")), None
             )
@@ -402,10 +459,8 @@ class PCloudDemo:
                 self.sdk.file.move(copied_file_id, folder_id=subfolder["folderid"])
                 print("✅ File moved successfully")
 
-            # Delete the copied file
-            print("\n🗑️ Deleting copied file...")
-            self.sdk.file.delete(copied_file_id)
-            print("✅ File deleted successfully")
+            # The copied file is swept by cleanup()'s single recursive delete
+            print("\n🗑️ Copied file will be removed with the demo folder")
 
         except Exception as e:
             print(f"❌ Error in file operations: {e}")
@@ -422,14 +477,15 @@ class PCloudDemo:
                 self.sdk.folder.delete_recursive(self.demo_folder_id)
                 print("✅ Demo folder cleaned up")
 
-            # Clean up temp files
-            for temp_file in self.temp_files:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    print(f"🗑️ Removed temp file: {os.path.basename(temp_file)}")
+            # Clean up local test files
+            self.temp_dir.cleanup()
+            print("🗑️ Removed local test files")
 
         except Exception as e:
             print(f"⚠️ Error during cleanup: {e}")
+        finally:
+            if self.session:
+                self.session.close()
 
     def run_complete_demo(self):
         """Run the complete demonstration"""
@@ -458,20 +514,39 @@ class PCloudDemo:
             print("\n👋 Demo finished")
 
 
+def parse_args() -> argparse.Namespace:
+    """Command line options for non-interactive runs"""
+    parser = argparse.ArgumentParser(description="pCloud SDK complete demo")
+    parser.add_argument("--email", default=os.environ.get("PCLOUD_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("PCLOUD_PASSWORD"))
+    parser.add_argument(
+        "--auth",
+        choices=["direct", "oauth2", "saved"],
+        help="Authentication method (default: ask)",
+    )
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="Run without confirmation"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main function to run the complete demo"""
+    args = parse_args()
+
     print("🚀 Welcome to the pCloud SDK Complete Demo!")
     print("This demo will showcase all major SDK features.")
     print()
 
     # Ask user if they want to proceed
-    proceed = input("Do you want to continue? (y/N): ").strip().lower()
-    if proceed not in ["y", "yes"]:
-        print("Demo cancelled.")
-        return
+    if not args.yes:
+        proceed = prompt("Do you want to continue? (y/N): ").lower()
+        if proceed not in ["y", "yes"]:
+            print("Demo cancelled.")
+            return
 
     # Run the demo
-    demo = PCloudDemo()
+    demo = PCloudDemo(email=args.email, password=args.password, auth=args.auth)
     demo.run_complete_demo()
 
 
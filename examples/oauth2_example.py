@@ -23,27 +23,36 @@ This example shows:
 """
 
 import threading
-import time
 import urllib.parse
 import webbrowser
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, Optional
 
+import requests
+
 from pcloud_sdk import PCloudException, PCloudSDK
 
+# Connection pool shared by every flow of the process; tokens are not, each
+# code exchange gets its own SDK
+_SESSION = requests.Session()
+
 
 class OAuth2CallbackHandler(BaseHTTPRequestHandler):
     """HTTP handler for OAuth2 callback"""
 
     def do_GET(self):
         """Handle GET request for OAuth2 callback"""
-        # Parse the callback URL
-        parsed_url = urllib.parse.urlparse(self.path)
-        query_params = urllib.parse.parse_qs(parsed_url.query)
+        # Parse the callback query string once
+        params = dict(urllib.parse.parse_qsl(urllib.parse.urlparse(self.path).query))
+
+        # Headers first: the status doesn't depend on the page we render
+        self.send_response_only(200)
+        self.send_header("Content-type", "text/html")
+        self.end_headers()
 
         # Extract authorization code or error
-        if "code" in query_params:
-            self.server.auth_code = query_params["code"][0]
+        if "code" in params:
+            self._store_result("auth_code", params["code"])
             response = """
             <html>
             <head><title>pCloud OAuth2 - Success</title></head>
@@ -54,17 +63,15 @@ class OAuth2CallbackHandler(BaseHTTPRequestHandler):
             </body>
             </html>
             """
-        elif "error" in query_params:
-            self.server.auth_error = query_params["error"][0]
-            error_description = query_params.get(
-                "error_description", ["Unknown error"]
-            )[0]
+        elif "error" in params:
+            self._store_result("auth_error", params["error"])
+            error_description = params.get("error_description", "Unknown error")
             response = f"""
             <html>
             <head><title>pCloud OAuth2 - Error</title></head>
             <body>
                 <h1>❌ Authorization Failed</h1>
-                <p>Error: {query_params['error'][0]}</p>
+                <p>Error: {params['error']}</p>
                 <p>Description: {error_description}</p>
                 <p>You can close this window.</p>
             </body>
@@ -81,12 +88,18 @@ class OAuth2CallbackHandler(BaseHTTPRequestHandler):
             </html>
             """
 
-        # Send response
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
-        self.end_headers()
         self.wfile.write(response.encode())
 
+        # Wake up wait_for_callback once we have a code or an error
+        if self.server.auth_code or self.server.auth_error:
+            self.server.done.set()
+
+    def _store_result(self, attribute: str, value: str):
+        """Keep the first code or error received, ignore later callbacks"""
+        with self.server.lock:
+            if not self.server.auth_code and not self.server.auth_error:
+                setattr(self.server, attribute, value)
+
     def log_message(self, format, *args):
         """Suppress default logging"""
         pass
@@ -114,13 +127,19 @@ class OAuth2FlowManager:
         self.redirect_uri = redirect_uri
         self.server = None
         self.server_thread = None
+        self._authorization_url: Optional[str] = None
 
     def start_callback_server(self, port: int = 8080) -> bool:
         """Start local server to handle OAuth2 callback"""
         try:
-            self.server = HTTPServer(("localhost", port), OAuth2CallbackHandler)
+            # Threaded, so a favicon or prefetch request can't delay the callback
+            self.server = ThreadingHTTPServer(
+                ("localhost", port), OAuth2CallbackHandler
+            )
             self.server.auth_code = None
             self.server.auth_error = None
+            self.server.lock = threading.Lock()
+            self.server.done = threading.Event()
 
             # Start server in separate thread
             self.server_thread = threading.Thread(target=self.server.serve_forever)
@@ -144,17 +163,19 @@ class OAuth2FlowManager:
             print("🛑 OAuth2 callback server stopped")
 
     def get_authorization_url(self) -> str:
-        """Generate OAuth2 authorization URL"""
-        base_url = "https://my.pcloud.com/oauth2/authorize"
-        params = {
-            "client_id": self.client_id,
-            "response_type": "code",
-            "redirect_uri": self.redirect_uri,
-            "state": "pcloud_sdk_example",  # Optional: add CSRF protection
-        }
-
-        query_string = urllib.parse.urlencode(params)
-        return f"{base_url}?{query_string}"
+        """Generate OAuth2 authorization URL (built once, inputs are fixed)"""
+        if self._authorization_url is None:
+            base_url = "https://my.pcloud.com/oauth2/authorize"
+            params = {
+                "client_id": self.client_id,
+                "response_type": "code",
+                "redirect_uri": self.redirect_uri,
+                "state": "pcloud_sdk_example",  # Optional: add CSRF protection
+            }
+
+            query_string = urllib.parse.urlencode(params)
+            self._authorization_url = f"{base_url}?{query_string}"
+        return self._authorization_url
 
     def wait_for_callback(self, timeout: int = 300) -> Optional[str]:
         """
@@ -166,20 +187,15 @@ class OAuth2FlowManager:
         Returns:
             Authorization code or None if timeout/error
         """
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            if hasattr(self.server, "auth_code") and self.server.auth_code:
-                return self.server.auth_code
-
-            if hasattr(self.server, "auth_error") and self.server.auth_error:
-                print(f"❌ OAuth2 authorization error: {self.server.auth_error}")
-                return None
+        if not self.server.done.wait(timeout):
+            print("⏰ Timeout waiting for OAuth2 callback")
+            return None
 
-            time.sleep(0.5)
+        if self.server.auth_error:
+            print(f"❌ OAuth2 authorization error: {self.server.auth_error}")
+            return None
 
-        print("⏰ Timeout waiting for OAuth2 callback")
-        return None
+        return self.server.auth_code
 
     def exchange_code_for_token(self, auth_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -197,6 +213,7 @@ class OAuth2FlowManager:
                 app_key=self.client_id,
                 app_secret=self.client_secret,
                 auth_type="oauth2",
+                session=_SESSION,
             )
 
             # Exchange code for token
@@ -210,6 +227,16 @@ class OAuth2FlowManager:
             return None
 
 
+def open_browser(url: str):
+    """Open the authorization page, falling back to manual instructions"""
+    try:
+        webbrowser.open_new_tab(url)
+        print("🌐 Browser opened. Please authorize the application.")
+    except Exception as e:
+        print(f"⚠️ Could not open browser automatically: {e}")
+        print(f"📋 Please manually visit: {url}")
+
+
 def oauth2_flow_example():
     """Complete OAuth2 flow example"""
     print("🔐 pCloud SDK OAuth2 Authentication Example")
@@ -237,14 +264,10 @@ def oauth2_flow_example():
         auth_url = oauth_manager.get_authorization_url()
         print(f"🔗 Authorization URL: {auth_url}")
 
-        # Step 3: Open browser (optional)
-        try:
-            print("\n3️⃣ Opening browser for authorization...")
-            webbrowser.open(auth_url)
-            print("🌐 Browser opened. Please authorize the application.")
-        except Exception as e:
-            print(f"⚠️ Could not open browser automatically: {e}")
-            print(f"📋 Please manually visit: {auth_url}")
+        # Step 3: Open browser (optional), in the background so we are
+        # already waiting when the callback arrives
+        print("\n3️⃣ Opening browser for authorization...")
+        threading.Thread(target=open_browser, args=(auth_url,), daemon=True).start()
 
         # Step 4: Wait for callback
         print("\n4️⃣ Waiting for authorization callback...")
@@ -282,7 +305,7 @@ def oauth2_flow_example():
             # Test API call
             user_info = sdk.user.get_user_info()
             print(f"👤 Successfully authenticated as: {user_info.get('email')}")
-            print(f"💾 Account quota: {user_info.get('quota', 0) // (1024**3):.1f} GB")
+            print(f"💾 Account quota: {user_info.get('quota', 0) >> 30:.1f} GB")
 
             # Optional: Save token for later use
             save_token = input("\n💾 Save token for later use? (y/n): ").strip().lower()
@@ -21,11 +21,17 @@ This example shows:
 - Performance monitoring
 """
 
-import csv
+import argparse
+import getpass
 import os
-import tempfile
+import queue
+import shutil
+import sys
+import threading
 import time
-from typing import List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
 
 from pcloud_sdk import PCloudException, PCloudSDK
 from pcloud_sdk.progress_utils import (
@@ -35,15 +41,28 @@ from pcloud_sdk.progress_utils import (
     create_silent_progress,
 )
 
+# Weight of the newest sample in the smoothed "current" speed
+EWMA_ALPHA = 0.2
+
+# Column positions in the SilentProgress CSV log
+CSV_TIMESTAMP_COLUMN = 0
+CSV_PERCENTAGE_COLUMN = 3
+CSV_SPEED_COLUMN = 6
+
 
 class CustomProgressTracker:
     """Custom progress tracker with advanced statistics"""
 
     def __init__(self, name: str = "Custom Progress"):
         self.name = name
+        # Monotonic: elapsed time and throttling are immune to clock jumps
+        self._clock = time.monotonic
         self.start_time = None
-        self.last_update = 0
-        self.speed_samples = []
+        self.last_update = 0.0
+        # Running aggregates keep memory and per-tick work constant
+        self.sample_count = 0
+        self.speed_total = 0.0
+        self.ewma_speed = 0.0
         self.max_speed = 0
         self.min_speed = float("inf")
 
@@ -57,44 +76,53 @@ class CustomProgressTracker:
     ):
         """Advanced progress tracking with statistics"""
 
+        now = self._clock()
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = now
             operation = kwargs.get("operation", "transfer")
             filename = kwargs.get("filename", "file")
-            print(f"\n📊 {self.name} - Starting {operation}: {filename}")
-            print(f"   📏 Size: {total_bytes:,} bytes ({total_bytes/1024/1024:.1f} MB)")
+            print(
+                f"\n📊 {self.name} - Starting {operation}: {filename}\n"
+                f"   📏 Size: {total_bytes:,} bytes ({total_bytes/1024/1024:.1f} MB)"
+            )
 
         # Update speed statistics
         if speed > 0:
-            self.speed_samples.append(speed)
-            self.max_speed = max(self.max_speed, speed)
+            if self.sample_count:
+                self.ewma_speed = (
+                    EWMA_ALPHA * speed + (1 - EWMA_ALPHA) * self.ewma_speed
+                )
+            else:
+                self.ewma_speed = speed
+            self.sample_count += 1
+            self.speed_total += speed
+            if speed > self.max_speed:
+                self.max_speed = speed
             if speed < self.min_speed:
                 self.min_speed = speed
 
         # Throttle updates
-        now = time.time()
         if now - self.last_update < 0.5 and percentage < 100:
             return
         self.last_update = now
 
         # Calculate statistics
         elapsed = now - self.start_time
-        avg_speed = (
-            sum(self.speed_samples) / len(self.speed_samples)
-            if self.speed_samples
-            else 0
-        )
+        avg_speed = self.speed_total / self.sample_count if self.sample_count else 0
 
-        # Display progress with statistics
+        # Display progress with statistics, one write per update
         status = kwargs.get("status", "progress")
 
         if status == "completed":
-            print(f"\n✅ {self.name} - Transfer completed!")
-            print(f"   ⏱️  Total time: {elapsed:.1f}s")
-            print(f"   📈 Average speed: {avg_speed/1024/1024:.1f} MB/s")
-            print(f"   🚀 Max speed: {self.max_speed/1024/1024:.1f} MB/s")
-            print(f"   🐌 Min speed: {self.min_speed/1024/1024:.1f} MB/s")
-            print(f"   📊 Speed samples: {len(self.speed_samples)}")
+            min_speed = self.min_speed if self.sample_count else 0
+            print(
+                f"\n✅ {self.name} - Transfer completed!\n"
+                f"   ⏱️  Total time: {elapsed:.1f}s\n"
+                f"   📈 Average speed: {avg_speed/1024/1024:.1f} MB/s\n"
+                f"   🚀 Max speed: {self.max_speed/1024/1024:.1f} MB/s\n"
+                f"   🐌 Min speed: {min_speed/1024/1024:.1f} MB/s\n"
+                f"   📊 Speed samples: {self.sample_count}"
+            )
         elif status == "error":
             error = kwargs.get("error", "Unknown error")
             print(f"\n❌ {self.name} - Error: {error}")
@@ -107,43 +135,108 @@ class CustomProgressTracker:
             print(
                 f"\r   [{bar}] {percentage:5.1f}% "
                 f"({bytes_transferred:,}/{total_bytes:,}) "
-                f"📶 {speed/1024/1024:5.1f}MB/s "
+                f"📶 {self.ewma_speed/1024/1024:5.1f}MB/s "
                 f"📊 Avg:{avg_speed/1024/1024:4.1f}MB/s",
                 end="",
                 flush=True,
             )
 
 
-def create_test_files(temp_dir: str) -> List[str]:
-    """Create test files of different sizes"""
-    test_files = []
+class BackgroundProgress:
+    """Run a progress callback on a worker thread, off the transfer path"""
 
-    # Small text file (1KB)
-    small_file = os.path.join(temp_dir, "small_test.txt")
-    with open(small_file, "w") as f:
-        f.write("Small test file content. " * 50)  # ~1KB
-    test_files.append(small_file)
+    _STOP = object()
+
+    def __init__(self, callback, maxsize: int = 1024):
+        self.callback = callback
+        self.queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def __call__(self, *args, **kwargs):
+        if kwargs.get("status", "progress") == "progress":
+            # Intermediate ticks are droppable, never block the transfer
+            try:
+                self.queue.put_nowait((args, kwargs))
+            except queue.Full:
+                pass
+        else:
+            # starting/completed/error must always reach the callback
+            self.queue.put((args, kwargs))
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is self._STOP:
+                return
+            args, kwargs = item
+            try:
+                self.callback(*args, **kwargs)
+            except Exception as e:
+                print(f"\n⚠️  Progress callback failed: {e}")
+
+    def close(self):
+        """Flush pending updates and stop the worker thread"""
+        self.queue.put(self._STOP)
+        self.worker.join()
 
-    # Medium text file (100KB)
-    medium_file = os.path.join(temp_dir, "medium_test.txt")
-    with open(medium_file, "w") as f:
-        content = "Medium test file content. " * 4000  # ~100KB
-        f.write(content)
-    test_files.append(medium_file)
 
-    # Large binary file (1MB)
-    large_file = os.path.join(temp_dir, "large_test.bin")
-    with open(large_file, "wb") as f:
-        # Write 1MB of random-like data
-        for i in range(1024):
-            chunk = bytes([(i + j) % 256 for j in range(1024)])
-            f.write(chunk)
-    test_files.append(large_file)
+def throttle(min_interval: float = 0.1):
+    """Drop progress ticks that arrive less than min_interval seconds apart
 
-    return test_files
+    Status changes (starting, completed, error, ...) always go through.
+    """
 
+    def decorator(callback):
+        last_call = [0.0]
 
-def demonstrate_simple_progress_bar(sdk: PCloudSDK, test_file: str):
+        def wrapper(bytes_transferred, total_bytes, percentage, speed, **kwargs):
+            now = time.monotonic()
+            if (
+                kwargs.get("status", "progress") == "progress"
+                and percentage < 100
+                and now - last_call[0] < min_interval
+            ):
+                return None
+            last_call[0] = now
+            return callback(bytes_transferred, total_bytes, percentage, speed, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _write_test_file(path: str, content: bytes) -> Dict[str, Any]:
+    with open(path, "wb") as f:
+        f.write(content)
+    # Record name and size once so the demos never re-parse or re-stat
+    return {"path": path, "name": os.path.basename(path), "size": len(content)}
+
+
+def create_test_files(temp_dir: str) -> List[Dict[str, Any]]:
+    """Create test files of different sizes
+
+    Returns one {"path", "name", "size"} dict per file.
+    """
+    specs = [
+        # Small text file (~1KB)
+        ("small_test.txt", b"Small test file content. " * 50),
+        # Medium text file (~100KB)
+        ("medium_test.txt", b"Medium test file content. " * 4000),
+        # Large binary file (1MB of random data)
+        ("large_test.bin", os.urandom(1 << 20)),
+    ]
+
+    # Each file targets its own path, so the writes can overlap
+    with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+        futures = [
+            executor.submit(_write_test_file, os.path.join(temp_dir, name), content)
+            for name, content in specs
+        ]
+        return [future.result() for future in futures]
+
+
+def demonstrate_simple_progress_bar(sdk: PCloudSDK, test_file: Dict[str, Any]):
     """Demonstrate SimpleProgressBar"""
     print("\n" + "=" * 60)
     print("1️⃣ SIMPLE PROGRESS BAR DEMONSTRATION")
@@ -161,29 +254,32 @@ def demonstrate_simple_progress_bar(sdk: PCloudSDK, test_file: str):
     )
 
     try:
-        print(f"\n📤 Uploading {os.path.basename(test_file)} with SimpleProgressBar...")
-        result = sdk.file.upload(test_file, folder_id=0, progress_callback=progress_bar)
+        print(f"\n📤 Uploading {test_file['name']} with SimpleProgressBar...")
+        result = sdk.file.upload(
+            test_file["path"], folder_id=0, progress_callback=progress_bar
+        )
         file_id = result.get("metadata", [{}])[0].get("fileid")
 
         if file_id:
             print("\n📥 Downloading file with SimpleProgressBar...")
+            import tempfile
+
             download_dir = tempfile.mkdtemp()
             progress_bar_dl = create_progress_bar("Simple Download", width=40)
-            sdk.file.download(
-                file_id, destination=download_dir, progress_callback=progress_bar_dl
-            )
-
-            # Cleanup
-            sdk.file.delete(file_id)
-            import shutil
-
-            shutil.rmtree(download_dir)
+            try:
+                sdk.file.download(
+                    file_id, destination=download_dir, progress_callback=progress_bar_dl
+                )
+            finally:
+                # Cleanup
+                sdk.file.delete(file_id)
+                shutil.rmtree(download_dir, ignore_errors=True)
 
     except PCloudException as e:
         print(f"❌ Error: {e}")
 
 
-def demonstrate_detailed_progress(sdk: PCloudSDK, test_file: str):
+def demonstrate_detailed_progress(sdk: PCloudSDK, test_file: Dict[str, Any]):
     """Demonstrate DetailedProgress"""
     print("\n" + "=" * 60)
     print("2️⃣ DETAILED PROGRESS DEMONSTRATION")
@@ -197,12 +293,14 @@ def demonstrate_detailed_progress(sdk: PCloudSDK, test_file: str):
 
     # Create detailed progress with log file
     log_file = "detailed_progress.log"
-    detailed_progress = create_detailed_progress(log_file=log_file)
+    detailed_progress = throttle(0.1)(
+        create_detailed_progress(log_file=log_file, max_checkpoints=4096)
+    )
 
     try:
-        print(f"\n📤 Uploading {os.path.basename(test_file)} with DetailedProgress...")
+        print(f"\n📤 Uploading {test_file['name']} with DetailedProgress...")
         result = sdk.file.upload(
-            test_file, folder_id=0, progress_callback=detailed_progress
+            test_file["path"], folder_id=0, progress_callback=detailed_progress
         )
         file_id = result.get("metadata", [{}])[0].get("fileid")
 
@@ -214,15 +312,15 @@ def demonstrate_detailed_progress(sdk: PCloudSDK, test_file: str):
         if os.path.exists(log_file):
             print("📄 Log file contents (last 5 lines):")
             with open(log_file, "r") as f:
-                lines = f.readlines()
-                for line in lines[-5:]:
+                # Stream the log, keeping only the last 5 lines in memory
+                for line in deque(f, maxlen=5):
                     print(f"   {line.strip()}")
 
     except PCloudException as e:
         print(f"❌ Error: {e}")
 
 
-def demonstrate_minimal_progress(sdk: PCloudSDK, test_file: str):
+def demonstrate_minimal_progress(sdk: PCloudSDK, test_file: Dict[str, Any]):
     """Demonstrate MinimalProgress"""
     print("\n" + "=" * 60)
     print("3️⃣ MINIMAL PROGRESS DEMONSTRATION")
@@ -238,9 +336,9 @@ def demonstrate_minimal_progress(sdk: PCloudSDK, test_file: str):
     minimal_progress = create_minimal_progress()
 
     try:
-        print(f"\n📤 Uploading {os.path.basename(test_file)} with MinimalProgress...")
+        print(f"\n📤 Uploading {test_file['name']} with MinimalProgress...")
         result = sdk.file.upload(
-            test_file, folder_id=0, progress_callback=minimal_progress
+            test_file["path"], folder_id=0, progress_callback=minimal_progress
         )
         file_id = result.get("metadata", [{}])[0].get("fileid")
 
@@ -252,7 +350,7 @@ def demonstrate_minimal_progress(sdk: PCloudSDK, test_file: str):
         print(f"❌ Error: {e}")
 
 
-def demonstrate_silent_progress(sdk: PCloudSDK, test_file: str):
+def demonstrate_silent_progress(sdk: PCloudSDK, test_file: Dict[str, Any]):
     """Demonstrate SilentProgress"""
     print("\n" + "=" * 60)
     print("4️⃣ SILENT PROGRESS DEMONSTRATION")
@@ -266,15 +364,19 @@ def demonstrate_silent_progress(sdk: PCloudSDK, test_file: str):
 
     # Create silent progress with CSV logging
     csv_file = "silent_progress.csv"
-    silent_progress = create_silent_progress(csv_file)
+    # Keep the CSV open with a 64KB buffer instead of reopening it per tick
+    silent_progress = create_silent_progress(csv_file, buffer_size=64 * 1024)
 
     try:
-        print(f"\n📤 Uploading {os.path.basename(test_file)} with SilentProgress...")
+        print(f"\n📤 Uploading {test_file['name']} with SilentProgress...")
         print("   (No progress output - check CSV file)")
 
-        result = sdk.file.upload(
-            test_file, folder_id=0, progress_callback=silent_progress
-        )
+        try:
+            result = sdk.file.upload(
+                test_file["path"], folder_id=0, progress_callback=silent_progress
+            )
+        finally:
+            silent_progress.close()
         file_id = result.get("metadata", [{}])[0].get("fileid")
 
         if file_id:
@@ -284,6 +386,8 @@ def demonstrate_silent_progress(sdk: PCloudSDK, test_file: str):
         print(f"\n📊 Progress data saved to: {csv_file}")
         if os.path.exists(csv_file):
             print("📊 CSV file contents (first 5 rows):")
+            import csv
+
             with open(csv_file, "r") as f:
                 reader = csv.reader(f)
                 for i, row in enumerate(reader):
@@ -296,7 +400,7 @@ def demonstrate_silent_progress(sdk: PCloudSDK, test_file: str):
         print(f"❌ Error: {e}")
 
 
-def demonstrate_custom_progress(sdk: PCloudSDK, test_file: str):
+def demonstrate_custom_progress(sdk: PCloudSDK, test_file: Dict[str, Any]):
     """Demonstrate custom progress tracker"""
     print("\n" + "=" * 60)
     print("5️⃣ CUSTOM PROGRESS DEMONSTRATION")
@@ -308,16 +412,18 @@ def demonstrate_custom_progress(sdk: PCloudSDK, test_file: str):
     print("   • Speed analysis")
     print("   • Fully customizable")
 
-    # Create custom progress tracker
-    custom_progress = CustomProgressTracker("Advanced Tracker")
+    # Create custom progress tracker, printed from a background thread so
+    # console output never stalls the upload
+    custom_progress = BackgroundProgress(CustomProgressTracker("Advanced Tracker"))
 
     try:
-        print(
-            f"\n📤 Uploading {os.path.basename(test_file)} with CustomProgressTracker..."
-        )
-        result = sdk.file.upload(
-            test_file, folder_id=0, progress_callback=custom_progress
-        )
+        print(f"\n📤 Uploading {test_file['name']} with CustomProgressTracker...")
+        try:
+            result = sdk.file.upload(
+                test_file["path"], folder_id=0, progress_callback=custom_progress
+            )
+        finally:
+            custom_progress.close()
         file_id = result.get("metadata", [{}])[0].get("fileid")
 
         if file_id:
@@ -328,7 +434,7 @@ def demonstrate_custom_progress(sdk: PCloudSDK, test_file: str):
         print(f"❌ Error: {e}")
 
 
-def batch_progress_demonstration(sdk: PCloudSDK, test_files: List[str]):
+def batch_progress_demonstration(sdk: PCloudSDK, test_files: List[Dict[str, Any]]):
     """Demonstrate progress tracking for batch operations"""
     print("\n" + "=" * 60)
     print("6️⃣ BATCH PROGRESS DEMONSTRATION")
@@ -339,41 +445,38 @@ def batch_progress_demonstration(sdk: PCloudSDK, test_files: List[str]):
     print("   • Batch operation statistics")
     print("   • Overall progress calculation")
 
-    # Batch progress tracker
+    # Batch progress tracker, shared by all upload workers
     class BatchProgressTracker:
         def __init__(self, total_files: int):
             self.total_files = total_files
             self.current_file = 0
             self.completed_files = 0
 
-        def create_file_callback(self, filename: str):
-            def callback(bytes_transferred, total_bytes, percentage, speed, **kwargs):
-                status = kwargs.get("status", "progress")
-                if status == "starting":
-                    self.current_file += 1
-                    print(
-                        f"\n📁 File {self.current_file}/{self.total_files}: {filename}"
-                    )
-                elif status == "completed":
-                    self.completed_files += 1
-                    overall_progress = (self.completed_files / self.total_files) * 100
-                    print(f"   ✅ Completed ({overall_progress:.1f}% overall)")
-                elif percentage % 25 == 0 and percentage > 0:
-                    print(f"   📊 {percentage:.0f}%...", end="", flush=True)
-
-            return callback
+        def __call__(self, bytes_transferred, total_bytes, percentage, speed, **kwargs):
+            status = kwargs.get("status", "progress")
+            filename = kwargs.get("filename", "file")
+            if status == "starting":
+                self.current_file += 1
+                print(f"\n📁 File {self.current_file}/{self.total_files}: {filename}")
+            elif status == "completed":
+                self.completed_files += 1
+                overall_progress = (self.completed_files / self.total_files) * 100
+                print(f"   ✅ {filename} completed ({overall_progress:.1f}% overall)")
 
     batch_tracker = BatchProgressTracker(len(test_files))
     uploaded_files = []
 
     try:
-        print(f"\n📤 Batch uploading {len(test_files)} files...")
-
-        for test_file in test_files:
-            filename = os.path.basename(test_file)
-            callback = batch_tracker.create_file_callback(filename)
-
-            result = sdk.file.upload(test_file, folder_id=0, progress_callback=callback)
+        print(f"\n📤 Batch uploading {len(test_files)} files in parallel...")
+
+        # upload_batch runs the uploads concurrently and serializes callbacks
+        results = sdk.file.upload_batch(
+            [test_file["path"] for test_file in test_files],
+            folder_id=0,
+            max_workers=len(test_files),
+            progress_callback=batch_tracker,
+        )
+        for result in results:
             file_id = result.get("metadata", [{}])[0].get("fileid")
             if file_id:
                 uploaded_files.append(file_id)
@@ -393,6 +496,39 @@ def batch_progress_demonstration(sdk: PCloudSDK, test_files: List[str]):
         print(f"❌ Error during batch operation: {e}")
 
 
+def _scan_progress_csv(csv_file: str) -> dict:
+    """Stream a SilentProgress CSV once, keeping online speed stats"""
+    import csv
+
+    stats = {
+        "records": 0,
+        "speed_count": 0,
+        "speed_sum": 0.0,
+        "max_speed": float("-inf"),
+        "min_speed": float("inf"),
+        "timeline": deque(maxlen=5),  # Last 5 records
+    }
+
+    with open(csv_file, "r", newline="") as f:
+        for row in csv.reader(f):
+            # Skip the "# ..." banner and header lines
+            if not row or row[0].startswith("#"):
+                continue
+            stats["records"] += 1
+            stats["timeline"].append(row)
+            try:
+                speed = float(row[CSV_SPEED_COLUMN])
+            except (IndexError, ValueError):
+                continue
+            if speed > 0:
+                stats["speed_count"] += 1
+                stats["speed_sum"] += speed
+                stats["max_speed"] = max(stats["max_speed"], speed)
+                stats["min_speed"] = min(stats["min_speed"], speed)
+
+    return stats
+
+
 def analyze_csv_logs():
     """Analyze CSV logs from silent progress"""
     print("\n" + "=" * 60)
@@ -405,39 +541,44 @@ def analyze_csv_logs():
         return
 
     try:
-        with open(csv_file, "r") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        stats = _scan_progress_csv(csv_file)
 
-        if not rows:
+        if not stats["records"]:
             print("📊 CSV file is empty")
             return
 
-        print(f"📊 Analyzing {len(rows)} progress records...")
-
-        # Calculate statistics
-        speeds = [float(row["speed_mbps"]) for row in rows if row["speed_mbps"]]
-        if speeds:
-            avg_speed = sum(speeds) / len(speeds)
-            max_speed = max(speeds)
-            min_speed = min(speeds)
+        print(f"📊 Analyzing {stats['records']} progress records...")
 
+        if stats["speed_count"]:
+            avg_speed = stats["speed_sum"] / stats["speed_count"]
             print(f"   📈 Average speed: {avg_speed:.2f} MB/s")
-            print(f"   🚀 Maximum speed: {max_speed:.2f} MB/s")
-            print(f"   🐌 Minimum speed: {min_speed:.2f} MB/s")
+            print(f"   🚀 Maximum speed: {stats['max_speed']:.2f} MB/s")
+            print(f"   🐌 Minimum speed: {stats['min_speed']:.2f} MB/s")
 
         # Show transfer timeline
         print("   ⏱️  Transfer timeline:")
-        for i, row in enumerate(rows[-5:]):  # Last 5 records
-            timestamp = row["timestamp"].split("T")[1][:8]  # Extract time
-            print(f"      {timestamp}: {row['percentage']}% - {row['speed_mbps']} MB/s")
+        for row in stats["timeline"]:
+            timestamp = row[CSV_TIMESTAMP_COLUMN].split("T")[1][:8]  # Extract time
+            percentage = row[CSV_PERCENTAGE_COLUMN]
+            speed_mbps = row[CSV_SPEED_COLUMN]
+            print(f"      {timestamp}: {percentage}% - {speed_mbps} MB/s")
 
     except Exception as e:
         print(f"❌ Error analyzing CSV: {e}")
 
 
-def main():
+def parse_args(argv=None):
+    """Command line options (default to PCLOUD_EMAIL / PCLOUD_PASSWORD)"""
+    parser = argparse.ArgumentParser(description="pCloud SDK progress examples")
+    parser.add_argument("--email", default=os.environ.get("PCLOUD_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("PCLOUD_PASSWORD"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main demonstration function"""
+    args = parse_args(argv)
+
     print("🚀 pCloud SDK Progress Tracking Examples")
     print("=" * 45)
 
@@ -445,32 +586,38 @@ def main():
     print("\n🔧 Setup...")
 
     # Get credentials
-    email = os.environ.get("PCLOUD_EMAIL")
-    password = os.environ.get("PCLOUD_PASSWORD")
+    email = args.email
+    password = args.password
 
     if not email or not password:
         print("📧 Environment variables not found")
-        email = input("Enter pCloud email: ").strip()
-        password = input("Enter pCloud password: ").strip()
+        print("💡 Tip: set PCLOUD_EMAIL and PCLOUD_PASSWORD or use --email/--password")
+
+        # Only prompt when a terminal is attached, never block headless runs
+        if sys.stdin.isatty():
+            email = email or input("Enter pCloud email: ").strip()
+            password = password or getpass.getpass("Enter pCloud password: ")
 
         if not email or not password:
             print("❌ Email and password required")
             return
 
     # Initialize SDK
+    temp_dir = None
     try:
         sdk = PCloudSDK()
         sdk.login(email, password)
         print("✅ Connected to pCloud")
 
         # Create test files
+        import tempfile
+
         temp_dir = tempfile.mkdtemp()
         print(f"📁 Creating test files in {temp_dir}...")
         test_files = create_test_files(temp_dir)
 
         for i, test_file in enumerate(test_files, 1):
-            size = os.path.getsize(test_file)
-            print(f"   {i}. {os.path.basename(test_file)} ({size:,} bytes)")
+            print(f"   {i}. {test_file['name']} ({test_file['size']:,} bytes)")
 
         # Run demonstrations
         print("\n🎬 Starting progress tracking demonstrations...")
@@ -504,13 +651,9 @@ def main():
         print(f"❌ Unexpected error: {e}")
     finally:
         # Cleanup
-        try:
-            import shutil
-
-            shutil.rmtree(temp_dir)
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
             print("\n🧹 Cleaned up temporary files")
-        except OSError:
-            pass
 
 
 if __name__ == "__main__":
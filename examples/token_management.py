@@ -19,11 +19,42 @@ This example covers:
 
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from pcloud_sdk import PCloudException, PCloudSDK
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson comes with the pcloud-sdk[fast] extra
+    from json import loads as json_loads
+
+# Bounds of the find_file_in_accounts result cache
+FIND_CACHE_SIZE = 1024
+FIND_CACHE_TTL = 60  # seconds
+
+# How long a token validation result is trusted
+VALIDATION_CACHE_TTL = 30  # seconds
+
+# Characters of an email that are rewritten in credential filenames
+_SAFE_EMAIL_TABLE = str.maketrans("@.", "__")
+
+
+def _read_credentials(path: str, size: int) -> Any:
+    """Parse a small credential file with one unbuffered read"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return json_loads(os.read(fd, size))
+    finally:
+        os.close(fd)
+
 
 class TokenManager:
     """Advanced token management utility"""
@@ -38,6 +69,38 @@ class TokenManager:
         self.base_dir = base_dir
         self.accounts = {}
         self.current_account = None
+        # (filename, folder_id, first_match, accounts) -> (expires_at, found)
+        self._find_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        # access_token -> (expires_at, valid, message)
+        self._validation_cache: Dict[str, Tuple[float, bool, str]] = {}
+        # One keep-alive session per validating thread (Session isn't
+        # thread-safe), so repeated checks skip the TLS handshake
+        self._validation_local = threading.local()
+
+    def token_file_for(self, email: str) -> str:
+        """
+        Credential file used for an email
+
+        Managed accounts keep the file they were added with; any other
+        email gets the manager's own .pcloud_<email> file in base_dir, never
+        a scanned file such as the SDK's shared .pcloud_credentials.
+
+        Args:
+            email: pCloud email
+
+        Returns:
+            Path of the credential file for this email
+        """
+        for info in self.accounts.values():
+            if info["email"] == email:
+                return info["token_file"]
+        return self._own_token_file(email)
+
+    def _own_token_file(self, email: str) -> str:
+        """Credential file this manager creates for an email"""
+        # Generate safe filename from email
+        safe_email = email.translate(_SAFE_EMAIL_TABLE)
+        return os.path.join(self.base_dir, f".pcloud_{safe_email}")
 
     def add_account(
         self, name: str, email: str, password: str, token_file: Optional[str] = None
@@ -54,14 +117,16 @@ class TokenManager:
         Returns:
             True if account added successfully
         """
+        # One keep-alive session per account, reused by all of its API calls
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
         try:
             if not token_file:
-                # Generate safe filename from email
-                safe_email = email.replace("@", "_").replace(".", "_")
-                token_file = os.path.join(self.base_dir, f".pcloud_{safe_email}")
+                token_file = self.token_file_for(email)
 
             # Initialize SDK for this account
-            sdk = PCloudSDK(token_file=token_file)
+            sdk = PCloudSDK(token_file=token_file, session=session)
 
             # Attempt login
             print(f"🔐 Logging in to account: {name} ({email})")
@@ -73,6 +138,7 @@ class TokenManager:
                 "password": password,  # Store securely in production!
                 "token_file": token_file,
                 "sdk": sdk,
+                "session": session,
                 "added_at": datetime.now().isoformat(),
             }
 
@@ -84,9 +150,11 @@ class TokenManager:
             return True
 
         except PCloudException as e:
+            session.close()
             print(f"❌ Failed to add account '{name}': {e}")
             return False
         except Exception as e:
+            session.close()
             print(f"❌ Unexpected error adding account '{name}': {e}")
             return False
 
@@ -94,13 +162,16 @@ class TokenManager:
         """
         Switch to a different account
 
+        An email with saved credentials in base_dir is picked up as a new
+        account, without logging in again.
+
         Args:
-            name: Account name to switch to
+            name: Account name (or saved email) to switch to
 
         Returns:
             True if switch successful
         """
-        if name not in self.accounts:
+        if name not in self.accounts and not self._add_saved_account(name):
             print(f"❌ Account '{name}' not found")
             return False
 
@@ -108,52 +179,230 @@ class TokenManager:
         print(f"🔄 Switched to account: {name}")
         return True
 
+    def _add_saved_account(self, email: str) -> bool:
+        """Manage a saved credential file, named after its email"""
+        # The file is read once: the same dict is validated and builds the SDK
+        saved = self.find_saved_account(email)
+        if not saved or not self.validate_token_data(saved["token_data"]):
+            return False
+
+        token_data = saved["token_data"]
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.accounts[email] = {
+            "email": email,
+            "password": None,
+            "token_file": saved["file"],
+            "sdk": PCloudSDK(
+                access_token=token_data["access_token"],
+                location_id=token_data.get("location_id", 2),
+                auth_type=token_data.get("auth_type", "direct"),
+                token_file=saved["file"],
+                session=session,
+            ),
+            "session": session,
+            "added_at": datetime.now().isoformat(),
+        }
+        print(f"📂 Loaded saved credentials for {email}")
+        return True
+
     def get_current_sdk(self) -> Optional[PCloudSDK]:
         """Get SDK instance for current account"""
-        if not self.current_account or self.current_account not in self.accounts:
+        account = self.accounts.get(self.current_account)
+        if account is None:
             print("❌ No current account selected")
             return None
 
-        return self.accounts[self.current_account]["sdk"]
+        return account["sdk"]
 
     def list_accounts(self):
-        """List all managed accounts"""
+        """
+        List all managed accounts
+
+        Token status comes from the last validate_all_tokens() run, so
+        listing never touches the network.
+        """
         if not self.accounts:
             print("📭 No accounts configured")
             return
 
         print("📋 Configured accounts:")
+        now = time.monotonic()
         for name, info in self.accounts.items():
             current_marker = "👉 " if name == self.current_account else "   "
             added_date = info["added_at"][:10]  # Just the date part
-            print(f"{current_marker}{name}: {info['email']} (added: {added_date})")
+            status = self._last_known_status(info["sdk"], now)
+            print(
+                f"{current_marker}{name}: {info['email']} "
+                f"(added: {added_date}){status}"
+            )
 
-    def validate_all_tokens(self) -> Dict[str, bool]:
+    def _last_known_status(self, sdk: PCloudSDK, now: float) -> str:
+        """Token status from the last validation, without any request"""
+        if not sdk.is_authenticated():
+            return " [logged out]"
+        cached = self._validation_cache.get(sdk.app.get_access_token())
+        if not cached:
+            return " [unchecked]"
+        # Expired entries are still the last known result, just not reused
+        checked_ago = now - (cached[0] - VALIDATION_CACHE_TTL)
+        state = "valid" if cached[1] else "invalid"
+        return f" [last known: {state}, checked {checked_ago:.0f}s ago]"
+
+    def authenticated_accounts(self) -> List[str]:
+        """Names of the accounts that hold an access token"""
+        return [
+            name
+            for name, info in self.accounts.items()
+            if info["sdk"].is_authenticated()
+        ]
+
+    def _search_account(
+        self, name: str, filename: str, folder_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Look for a file in one account's folder"""
+        sdk = self.accounts[name]["sdk"]
+        for item in sdk.folder.get_content(folder_id):
+            if not item.get("isfolder") and item.get("name") == filename:
+                return item
+        return None
+
+    def find_file_in_accounts(
+        self,
+        filename: str,
+        folder_id: int = 0,
+        first_match: bool = False,
+        use_cache: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find a file across all accounts
+
+        Each account is queried from its own worker thread so the search
+        costs roughly one round-trip instead of one per account.
+
+        Args:
+            filename: Name of the file to look for
+            folder_id: Folder to search in each account (root by default)
+            first_match: Return as soon as one account has the file
+            use_cache: Reuse a result less than FIND_CACHE_TTL seconds old
+
+        Returns:
+            Dict mapping account names to the matching file metadata
+        """
+        names = self.authenticated_accounts()
+        if not names:
+            return {}
+
+        key = (filename, folder_id, first_match, tuple(sorted(names)))
+        if use_cache:
+            cached = self._find_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self._find_cache.move_to_end(key)
+                return dict(cached[1])
+
+        executor = ThreadPoolExecutor(max_workers=len(names))
+        futures = {
+            executor.submit(self._search_account, name, filename, folder_id): name
+            for name in names
+        }
+        pending = set(futures)
+        found = {}
+        failed = False
+        try:
+            while pending and not (first_match and found):
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures[future]
+                    try:
+                        item = future.result()
+                    except Exception as e:
+                        print(f"❌ {name}: Search failed ({e})")
+                        failed = True
+                        continue
+                    if item:
+                        found[name] = item
+        finally:
+            # Searches still running after a first match are simply dropped
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        # Only complete searches are worth reusing
+        if not failed:
+            self._find_cache[key] = (time.monotonic() + FIND_CACHE_TTL, dict(found))
+            self._find_cache.move_to_end(key)
+            if len(self._find_cache) > FIND_CACHE_SIZE:
+                self._find_cache.popitem(last=False)
+        return found
+
+    def _check_tokens(self, names: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """Probe the API for each account, all requests in flight at once"""
+        # refresh() hits the API: the user info cached at login proves nothing
+        with ThreadPoolExecutor(max_workers=min(32, len(names))) as executor:
+            futures = {
+                name: executor.submit(
+                    self._refresh_user_info, self.accounts[name]["sdk"]
+                )
+                for name in names
+            }
+
+        checks = {}
+        for name, future in futures.items():
+            token = self.accounts[name]["sdk"].app.get_access_token()
+            try:
+                user_info = future.result()
+                checks[name] = (True, f"Token valid (user: {user_info.get('email')})")
+            except PCloudException as e:
+                checks[name] = (False, f"Token invalid ({e})")
+            except Exception as e:
+                # Network trouble says nothing about the token: not cached
+                checks[name] = (False, f"Validation error ({e})")
+                continue
+            expires_at = time.monotonic() + VALIDATION_CACHE_TTL
+            self._validation_cache[token] = (expires_at,) + checks[name]
+        return checks
+
+    @staticmethod
+    def _refresh_user_info(sdk: PCloudSDK) -> Dict[str, Any]:
+        """Fetch fresh user info, entirely inside the calling worker"""
+        # Building sdk.user may itself request userinfo (accounts loaded from
+        # saved tokens), so it must not run in the submitting thread either
+        return sdk.user.refresh()
+
+    def validate_all_tokens(self, use_cache: bool = True) -> Dict[str, bool]:
         """
         Validate tokens for all accounts
 
+        Args:
+            use_cache: Reuse results less than VALIDATION_CACHE_TTL seconds old
+
         Returns:
             Dict mapping account names to validation status
         """
-        results = {}
-
         print("🔍 Validating tokens for all accounts...")
 
+        checks: Dict[str, Tuple[bool, str]] = {}
+        stale = []
+        now = time.monotonic()
         for name, info in self.accounts.items():
-            try:
-                sdk = info["sdk"]
-                user_info = sdk.user.get_user_info()
-                results[name] = True
-                print(f"✅ {name}: Token valid (user: {user_info.get('email')})")
+            # Accounts without a token fail without any request
+            if not info["sdk"].is_authenticated():
+                checks[name] = (False, "Not logged in")
+                continue
+            token = info["sdk"].app.get_access_token()
+            cached = self._validation_cache.get(token) if use_cache else None
+            if cached and cached[0] > now:
+                checks[name] = (cached[1], f"{cached[2]} [cached]")
+            else:
+                stale.append(name)
 
-            except PCloudException as e:
-                results[name] = False
-                print(f"❌ {name}: Token invalid ({e})")
-            except Exception as e:
-                results[name] = False
-                print(f"❌ {name}: Validation error ({e})")
+        if stale:
+            checks.update(self._check_tokens(stale))
 
-        return results
+        for name in self.accounts:
+            valid, message = checks[name]
+            print(f"{'✅' if valid else '❌'} {name}: {message}")
+        return {name: checks[name][0] for name in self.accounts}
 
     def cleanup_invalid_tokens(self):
         """Remove accounts with invalid tokens"""
@@ -184,19 +433,22 @@ class TokenManager:
         Returns:
             True if removal successful
         """
-        if name not in self.accounts:
+        # Remove from memory and release its connections
+        account = self.accounts.pop(name, None)
+        if account is None:
             print(f"❌ Account '{name}' not found")
             return False
 
-        # Get token file path
-        token_file = self.accounts[name]["token_file"]
-
-        # Remove from memory
-        del self.accounts[name]
+        token_file = account["token_file"]
+        self._validation_cache.pop(account["sdk"].app.get_access_token(), None)
+        account["session"].close()
 
-        # Remove token file
+        # Remove token file, only if it is one this manager created: an
+        # adopted file may be the SDK's .pcloud_credentials or a demo's
+        own_file = self._own_token_file(account["email"])
+        owned = os.path.abspath(token_file) == os.path.abspath(own_file)
         try:
-            if os.path.exists(token_file):
+            if owned and os.path.exists(token_file):
                 os.remove(token_file)
                 print(f"🗑️ Removed token file: {token_file}")
         except Exception as e:
@@ -205,7 +457,7 @@ class TokenManager:
         # Update current account if necessary
         if self.current_account == name:
             if self.accounts:
-                self.current_account = list(self.accounts.keys())[0]
+                self.current_account = next(iter(self.accounts))
                 print(f"🔄 Switched to account: {self.current_account}")
             else:
                 self.current_account = None
@@ -214,6 +466,130 @@ class TokenManager:
         print(f"✅ Account '{name}' removed")
         return True
 
+    def iter_saved_accounts(self) -> Iterator[Dict[str, Any]]:
+        """
+        Scan base_dir for saved credential files, lazily
+
+        Files are read one at a time as the caller iterates, so a lookup
+        that stops at the first match leaves the rest unread.
+
+        Yields:
+            One dict per credential file (email, file, age_days, permissions,
+            token_data), in directory order
+        """
+        now = time.time()
+
+        try:
+            entries = os.scandir(self.base_dir)
+        except FileNotFoundError:
+            return
+
+        # DirEntry carries the name and type from the directory read itself,
+        # so non-matching entries are skipped without any stat() call
+        with entries:
+            for entry in entries:
+                if not entry.name.startswith(".pcloud_"):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    # Cached on the DirEntry: at most one stat per file, which
+                    # also sizes the single read of these sub-KB files
+                    stat = entry.stat(follow_symlinks=False)
+                    credentials = _read_credentials(entry.path, stat.st_size)
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(credentials, dict):
+                    continue
+                if "access_token" not in credentials:
+                    continue
+
+                yield {
+                    "email": credentials.get("email", "Unknown"),
+                    "file": entry.path,
+                    "age_days": (now - credentials.get("saved_at", 0)) / 86400,
+                    "permissions": oct(stat.st_mode)[-3:],
+                    # Parsed once here, reused by validate_token_data()
+                    "token_data": credentials,
+                }
+
+    def list_saved_accounts(self) -> List[Dict[str, Any]]:
+        """
+        Scan base_dir for saved credential files
+
+        Returns:
+            One dict per credential file (email, file, age_days, permissions,
+            token_data), most recent first
+        """
+        return sorted(self.iter_saved_accounts(), key=lambda acc: acc["age_days"])
+
+    def find_saved_account(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the saved credential file of an email
+
+        Stops reading files at the first match.
+
+        Args:
+            email: pCloud email
+
+        Returns:
+            The saved account dict (see iter_saved_accounts) or None
+        """
+        return next(
+            (acc for acc in self.iter_saved_accounts() if acc["email"] == email),
+            None,
+        )
+
+    def _validation_session(self) -> requests.Session:
+        """This thread's session for validate_token_data()"""
+        session = getattr(self._validation_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._validation_local.session = session
+        return session
+
+    def validate_token_data(self, token_data: Dict[str, Any]) -> bool:
+        """
+        Check saved credentials against the API
+
+        Takes the already-parsed credentials (see list_saved_accounts), so
+        the token file is not read again.
+
+        Args:
+            token_data: Saved credentials dict
+
+        Returns:
+            True if the token is accepted by the API
+        """
+        token = token_data.get("access_token")
+        if not token:
+            return False
+
+        cached = self._validation_cache.get(token)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        sdk = PCloudSDK(
+            access_token=token,
+            location_id=token_data.get("location_id", 2),
+            auth_type=token_data.get("auth_type", "direct"),
+            token_manager=False,
+            session=self._validation_session(),
+        )
+        try:
+            # Building the User object fetches userinfo with this token
+            user_info = sdk.user.get_user_info()
+            valid, message = True, f"Token valid (user: {user_info.get('email')})"
+        except PCloudException as e:
+            valid, message = False, f"Token invalid ({e})"
+        except Exception:
+            # Network trouble says nothing about the token: not cached
+            return False
+
+        expires_at = time.monotonic() + VALIDATION_CACHE_TTL
+        self._validation_cache[token] = (expires_at, valid, message)
+        return valid
+
     def get_account_info(self, name: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about an account
@@ -227,11 +603,11 @@ class TokenManager:
         if not name:
             name = self.current_account
 
-        if not name or name not in self.accounts:
+        account = self.accounts.get(name)
+        if account is None:
             print(f"❌ Account '{name}' not found")
             return None
 
-        account = self.accounts[name]
         sdk = account["sdk"]
 
         try:
@@ -439,8 +815,8 @@ def demonstrate_multi_account_management():
         print(f"   📧 Email: {current_info['email']}")
         print(f"   📅 Added: {current_info['added_at'][:10]}")
         print(f"   ⏰ Token age: {current_info['credentials_age_days']:.2f} days")
-        print(f"   💾 Quota: {current_info['user_quota'] // (1024**3):.1f} GB")
-        print(f"   📁 Used: {current_info['user_used_quota'] // (1024**3):.1f} GB")
+        print(f"   💾 Quota: {current_info['user_quota'] >> 30:.1f} GB")
+        print(f"   📁 Used: {current_info['user_used_quota'] >> 30:.1f} GB")
 
     # Test API call with current account
     current_sdk = token_manager.get_current_sdk()
@@ -475,6 +851,16 @@ def demonstrate_multi_account_management():
                         print(f"   ❌ API test with {name} failed: {e}")
                 break
 
+    # Search a file in every account at once
+    filename = input("\n🔎 File name to look for in all accounts: ").strip()
+    if filename:
+        matches = token_manager.find_file_in_accounts(filename, first_match=True)
+        if matches:
+            name, item = next(iter(matches.items()))
+            print(f"   ✅ Found in {name}: {item['name']} (ID: {item.get('fileid')})")
+        else:
+            print("   📭 File not found in any account")
+
     # Validate all tokens
     print("\n🔍 Token validation:")
     token_manager.validate_all_tokens()
@@ -520,9 +906,12 @@ def demonstrate_token_security_practices():
         sdk.login(email, password)
         print("✅ Secure login completed")
 
-        # Check file permissions
-        if os.path.exists(secure_token_file):
+        # Check file permissions (one stat, no separate existence probe)
+        try:
             stat_info = os.stat(secure_token_file)
+        except FileNotFoundError:
+            stat_info = None
+        if stat_info:
             permissions = oct(stat_info.st_mode)[-3:]
             print(f"🔒 Token file permissions: {permissions}")
 
@@ -570,6 +959,48 @@ def demonstrate_token_security_practices():
         print(f"❌ Unexpected error: {e}")
 
 
+def demonstrate_saved_credentials():
+    """Demonstrate discovery of saved credential files"""
+    print("\n" + "=" * 60)
+    print("5️⃣ SAVED CREDENTIAL FILES")
+    print("=" * 60)
+
+    print("📋 Features:")
+    print("   • Find every saved token in a directory")
+    print("   • Token age at a glance")
+    print("   • No login required")
+
+    token_manager = TokenManager()
+    saved_accounts = token_manager.list_saved_accounts()
+
+    if not saved_accounts:
+        print(f"\n📭 No saved credentials in {os.path.abspath(token_manager.base_dir)}")
+        return
+
+    print(f"\n🔑 {len(saved_accounts)} saved credential file(s):")
+    for account in saved_accounts:
+        print(
+            f"   📧 {account['email']} - {account['file']} "
+            f"({account['age_days']:.1f} days old, mode {account['permissions']})"
+        )
+        # Group or other bits set: other local users can access the token
+        if os.name == "posix" and account["permissions"][1:] != "00":
+            print("      ⚠️ Accessible to other users, run: chmod 600 <file>")
+
+    if input("\n🔍 Validate saved tokens? (y/n): ").strip().lower() != "y":
+        return
+
+    # Validate from the data parsed during the scan, no file is re-read
+    with ThreadPoolExecutor(max_workers=min(32, len(saved_accounts))) as executor:
+        statuses = executor.map(
+            token_manager.validate_token_data,
+            [account["token_data"] for account in saved_accounts],
+        )
+        for account, valid in zip(saved_accounts, statuses):
+            status = "✅ valid" if valid else "❌ invalid or unreachable"
+            print(f"   {account['email']}: {status}")
+
+
 def main():
     """Main demonstration function"""
     print("🔑 pCloud SDK Token Management Examples")
@@ -581,9 +1012,10 @@ def main():
         print("2. Manual token management")
         print("3. Multi-account management")
         print("4. Token security practices")
-        print("5. Exit")
+        print("5. Saved credential files")
+        print("6. Exit")
 
-        choice = input("Enter choice (1-5): ").strip()
+        choice = input("Enter choice (1-6): ").strip()
 
         if choice == "1":
             demonstrate_automatic_token_management()
@@ -594,10 +1026,12 @@ def main():
         elif choice == "4":
             demonstrate_token_security_practices()
         elif choice == "5":
+            demonstrate_saved_credentials()
+        elif choice == "6":
             print("👋 Goodbye!")
             break
         else:
-            print("❌ Invalid choice. Please enter 1-5.")
+            print("❌ Invalid choice. Please enter 1-6.")
 
 
 if __name__ == "__main__":
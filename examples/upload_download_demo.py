@@ -18,82 +18,265 @@ This comprehensive demo covers:
 - Real-world transfer scenarios
 """
 
+import argparse
+import getpass
 import hashlib
 import os
+import queue
 import shutil
+import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
-from pcloud_sdk import PCloudSDK, create_progress_bar
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from pcloud_sdk import Config, PCloudSDK, create_progress_bar
 
-def create_test_files() -> List[str]:
-    """Create various test files for upload demonstrations"""
+# How downloads are verified: "size" (default, TLS already protects the
+# transfer), "sample" (hash 3 regions of 1MB) or "full" (hash everything)
+VERIFY_MODE = os.environ.get("PCLOUD_DEMO_VERIFY", "size")
+
+
+def create_test_files() -> Dict[str, int]:
+    """Create various test files for upload demonstrations
+
+    Returns:
+        The size of each created file by path, in creation order; sizes come
+        from the written data, so the files never need to be stat'ed
+    """
     temp_dir = tempfile.gettempdir()
-    test_files = []
+    contents = {}
 
     # Small text file
-    small_file = os.path.join(temp_dir, "small_document.txt")
-    with open(small_file, "w") as f:
-        f.write("This is a small test document.\n" * 100)
-    test_files.append(small_file)
+    contents["small_document.txt"] = b"This is a small test document.\n" * 100
 
     # Medium binary file
-    medium_file = os.path.join(temp_dir, "medium_data.bin")
-    with open(medium_file, "wb") as f:
-        # Create pseudo-random binary data
-        for i in range(1024):  # 1MB
-            chunk = bytes([(i * 137 + j) % 256 for j in range(1024)])
-            f.write(chunk)
-    test_files.append(medium_file)
+    # Create pseudo-random binary data: row i holds (i * 137 + j) % 256,
+    # i.e. the byte ramp rotated by i * 137, built from slices
+    ramp = bytes(range(256))
+    rows = []
+    for i in range(1024):  # 1MB
+        offset = (i * 137) % 256
+        rows.append((ramp[offset:] + ramp[:offset]) * 4)
+    contents["medium_data.bin"] = b"".join(rows)
 
     # Large text file
-    large_file = os.path.join(temp_dir, "large_document.txt")
-    with open(large_file, "w") as f:
-        for i in range(50000):  # ~5MB
-            f.write(
-                f"Line {i:06d}: This is line number {i} in our large test document.\n"
-            )
-    test_files.append(large_file)
+    contents["large_document.txt"] = "".join(
+        f"Line {i:06d}: This is line number {i} in our large test document.\n"
+        for i in range(50000)  # ~5MB
+    ).encode()
 
     # Image-like file (for MIME type testing)
-    fake_image = os.path.join(temp_dir, "test_image.jpg")
-    with open(fake_image, "wb") as f:
-        # Create a fake JPEG header
-        f.write(b"\xff\xd8\xff\xe0")  # JPEG magic bytes
-        f.write(b"\x00" * 10240)  # 10KB of zeros
-    test_files.append(fake_image)
+    # Fake JPEG: magic bytes then 10KB of zeros
+    contents["test_image.jpg"] = b"\xff\xd8\xff\xe0" + bytes(10240)
+
+    test_files = {}
+    for name, data in contents.items():
+        file_path = os.path.join(temp_dir, name)
+        with open(file_path, "wb") as f:
+            f.write(data)
+        test_files[file_path] = len(data)
 
     print(f"✓ Created {len(test_files)} test files:")
-    for file_path in test_files:
-        size = os.path.getsize(file_path)
+    for file_path, size in test_files.items():
         print(f"   • {os.path.basename(file_path)} ({size:,} bytes)")
 
     return test_files
 
 
+def advise_sequential(f):
+    """Ask the kernel for aggressive read-ahead on a file read front to back
+
+    The reads stay plain blocking reads, but the page cache is filled ahead
+    of them, so hashing and uploading rarely wait on the disk (Linux/BSD).
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
 def calculate_file_hash(file_path: str) -> str:
     """Calculate SHA256 hash of a file for integrity verification"""
+    with open(file_path, "rb") as f:
+        advise_sequential(f)
+        # Python 3.11+: the whole loop runs in C
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+        # Older versions: 1MB reads into one reused buffer, no copies
+        hash_sha256 = hashlib.sha256()
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            hash_sha256.update(view[:size])
+    return hash_sha256.hexdigest()
+
+
+def calculate_sample_hash(file_path: str, size: int) -> str:
+    """SHA256 of the first, middle and last 1MB of a file"""
+    block = 1024 * 1024
     hash_sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_sha256.update(chunk)
+        for offset in (0, size // 2, max(0, size - block)):
+            f.seek(offset)
+            hash_sha256.update(f.read(block))
     return hash_sha256.hexdigest()
 
 
+class HashingReader:
+    """Binary file reader that hashes the bytes as they are read
+
+    Passed to ``sdk.file.upload()`` in place of a path, it yields the file's
+    SHA256 from the same pass that uploads it.
+    """
+
+    def __init__(self, file_path: str):
+        self.name = file_path
+        self._file = open(file_path, "rb")
+        advise_sequential(self._file)
+        self._hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        self._hash.update(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def fileno(self) -> int:
+        return self._file.fileno()
+
+    def hexdigest(self) -> str:
+        """SHA256 of everything read so far"""
+        return self._hash.hexdigest()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self) -> "HashingReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReadAheadReader:
+    """Reader that fetches the next chunks from a background thread
+
+    A producer thread keeps up to ``depth`` chunks of ``chunk_size`` bytes
+    queued while ``sdk.file.upload()`` sends the current one, so disk reads
+    overlap network writes. Each ``read()`` returns the next queued chunk
+    whatever size is asked for: pass the same ``chunk_size`` to ``upload()``.
+    """
+
+    def __init__(self, source, chunk_size: int, depth: int = 8):
+        self.name = getattr(source, "name", "")
+        self._source = source
+        self._position = source.tell()
+        self._chunks: "queue.Queue[bytes]" = queue.Queue(maxsize=depth)
+        self._error: Optional[BaseException] = None
+        self._eof = False
+        self._closed = threading.Event()
+        self._producer = threading.Thread(
+            target=self._produce, args=(chunk_size,), daemon=True
+        )
+        self._producer.start()
+
+    def _produce(self, chunk_size: int):
+        try:
+            while True:
+                chunk = self._source.read(chunk_size)
+                if not self._put(chunk) or not chunk:
+                    return
+        except Exception as e:
+            self._error = e
+            self._put(b"")
+
+    def _put(self, chunk: bytes) -> bool:
+        """Queue a chunk, giving up once the reader is closed"""
+        while not self._closed.is_set():
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        if self._eof:
+            return b""
+        chunk = self._chunks.get()
+        if not chunk:
+            self._eof = True
+            if self._error:
+                raise self._error
+        self._position += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        """Position of the bytes handed out, not of the read-ahead"""
+        return self._position
+
+    def fileno(self) -> int:
+        return self._source.fileno()
+
+    def close(self):
+        self._closed.set()
+        self._producer.join()
+
+    def __enter__(self) -> "ReadAheadReader":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def pick_chunk_size(file_size: int) -> int:
+    """Upload chunk size for a file
+
+    Every chunk is one ``upload_write`` request: files up to 8 parts keep the
+    SDK's 10MB default, larger ones are sent in 8 bigger chunks (64MB max).
+    """
+    return min(max(file_size // 8, Config.FILE_PART_SIZE), 64 * 1024 * 1024)
+
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+SIZE_DIVISORS = (1.0, 1024.0, 1024.0**2, 1024.0**3, 1024.0**4)
+
+
 def format_size(bytes_size: int) -> str:
     """Format bytes to human readable format"""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if bytes_size < 1024.0:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024.0
-    return f"{bytes_size:.1f} TB"
+    # Every 10 bits is one 1024 step: the unit comes straight from bit_length
+    unit = min((max(int(bytes_size), 1).bit_length() - 1) // 10, 4)
+    return f"{bytes_size / SIZE_DIVISORS[unit]:.1f} {SIZE_UNITS[unit]}"
 
 
 def format_speed(bytes_per_second: float) -> str:
     """Format transfer speed"""
-    return f"{bytes_per_second / (1024 * 1024):.1f} MB/s"
+    return f"{bytes_per_second / 1048576.0:.1f} MB/s"
+
+
+def prompt(message: str) -> str:
+    """Ask the user for a value, or return "" when no terminal is attached"""
+    if not sys.stdin.isatty():
+        return ""
+    return input(message).strip()
+
+
+def safe_rate(amount: float, seconds: float) -> float:
+    """amount / seconds, 0 until some time has elapsed"""
+    return amount / seconds if seconds > 0 else 0.0
 
 
 class AdvancedProgressTracker:
@@ -103,8 +286,8 @@ class AdvancedProgressTracker:
         self.file_name = file_name
         self.start_time = None
         self.last_update = 0
-        self.speed_samples = []
-        self.bytes_history = []
+        # Only the peak is reported, so track it as a scalar
+        self.max_speed = 0.0
 
     def __call__(
         self,
@@ -127,19 +310,15 @@ class AdvancedProgressTracker:
         status = kwargs.get("status", "progress")
 
         # Collect performance data
-        if speed > 0:
-            self.speed_samples.append(speed)
-
-        self.bytes_history.append((current_time, bytes_transferred))
+        self.max_speed = max(self.max_speed, speed)
 
         # Update display every 1 second or on status change
         if current_time - self.last_update >= 1.0 or status != "progress":
             self.last_update = current_time
+            elapsed = current_time - self.start_time
+            avg_speed = safe_rate(bytes_transferred, elapsed)
 
             if status == "progress":
-                elapsed = current_time - self.start_time
-                avg_speed = bytes_transferred / elapsed if elapsed > 0 else 0
-
                 # Calculate ETA
                 if speed > 0:
                     remaining_bytes = total_bytes - bytes_transferred
@@ -158,24 +337,61 @@ class AdvancedProgressTracker:
                 )
 
             elif status == "completed":
-                elapsed = current_time - self.start_time
-                avg_speed = bytes_transferred / elapsed if elapsed > 0 else 0
-                max_speed = max(self.speed_samples) if self.speed_samples else 0
-
                 print(f"  ✓ Transfer completed in {elapsed:.1f}s")
                 print(f"      Average speed: {format_speed(avg_speed)}")
-                print(f"      Peak speed: {format_speed(max_speed)}")
-                print(
-                    f"      Efficiency: {(avg_speed/max_speed*100):.0f}%"
-                    if max_speed > 0
-                    else ""
-                )
+                print(f"      Peak speed: {format_speed(self.max_speed)}")
+                if self.max_speed > 0:
+                    efficiency = avg_speed / self.max_speed * 100
+                    print(f"      Efficiency: {efficiency:.0f}%")
 
             elif status == "error":
                 error = kwargs.get("error", "Unknown error")
                 print(f"   ✗ Transfer failed: {error}")
 
 
+class ConsolePrinter:
+    """Writes lines from a background thread, several at a time
+
+    Transfer threads only enqueue their progress lines, so they never wait
+    on stdout; the printer writes whatever is queued about 4 times a second
+    until close() is called.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._closing = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def print(self, line: str):
+        """Queue a line for printing"""
+        self.lines.put(line)
+
+    def close(self):
+        """Write every queued line, then stop the printer thread"""
+        self._closing.set()  # Cuts the pause between writes short
+        self.lines.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            batch = [self.lines.get()]
+            while True:
+                try:
+                    batch.append(self.lines.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            if None in batch:
+                return
+            # Lets the next lines pile up into one write
+            self._closing.wait(self.interval)
+
+
 class BatchProgressManager:
     """Manager for tracking progress of multiple file operations"""
 
@@ -183,9 +399,27 @@ class BatchProgressManager:
         self.operation_name = operation_name
         self.files = {}
         self.start_time = time.time()
+        # Serializes the progress callbacks of parallel transfers
+        self.lock = threading.Lock()
+        # Batch totals kept up to date per event, instead of summing over
+        # every file on each progress tick
+        self.total_size = 0
+        self.total_transferred = 0
+        self.completed_count = 0
+        # Printer thread of the batch, only alive inside its `with` block
+        self.console: Optional[ConsolePrinter] = None
+
+    def __enter__(self):
+        self.console = ConsolePrinter()
+        return self
+
+    def __exit__(self, *exc_info):
+        # Progress lines still queued are written before anything after
+        self.console.close()
 
     def add_file(self, file_name: str, size: int):
         """Add a file to track"""
+        self.total_size += size
         self.files[file_name] = {
             "size": size,
             "transferred": 0,
@@ -205,40 +439,47 @@ class BatchProgressManager:
         ):
             status = kwargs.get("status", "progress")
 
-            if file_name in self.files:
-                file_info = self.files[file_name]
+            # Parallel transfers report from several threads
+            with self.lock:
+                if file_name in self.files:
+                    file_info = self.files[file_name]
 
-                if file_info["start_time"] is None:
-                    file_info["start_time"] = time.time()
+                    if file_info["start_time"] is None:
+                        file_info["start_time"] = time.time()
 
-                file_info["transferred"] = bytes_transferred
+                    self.total_transferred += (
+                        bytes_transferred - file_info["transferred"]
+                    )
+                    file_info["transferred"] = bytes_transferred
 
-                if status == "completed":
-                    file_info["completed"] = True
-                    elapsed = time.time() - file_info["start_time"]
-                    avg_speed = bytes_transferred / elapsed if elapsed > 0 else 0
-                    print(f"  ✓ {file_name}: {format_speed(avg_speed)}")
+                    if status == "completed" and not file_info["completed"]:
+                        file_info["completed"] = True
+                        self.completed_count += 1
+                        elapsed = time.time() - file_info["start_time"]
+                        avg_speed = safe_rate(bytes_transferred, elapsed)
+                        self.console.print(
+                            f"  ✓ {file_name}: {format_speed(avg_speed)}"
+                        )
 
-                elif status == "error":
-                    print(f"   ✗ {file_name}: {kwargs.get('error', 'Failed')}")
+                    elif status == "error":
+                        error = kwargs.get("error", "Failed")
+                        self.console.print(f"   ✗ {file_name}: {error}")
 
-                # Update overall progress
-                self._update_overall_progress()
+                    # Update overall progress
+                    self._update_overall_progress()
 
         return progress_callback
 
     def _update_overall_progress(self):
         """Update and display overall batch progress"""
-        total_size = sum(f["size"] for f in self.files.values())
-        total_transferred = sum(f["transferred"] for f in self.files.values())
-        completed_count = sum(1 for f in self.files.values() if f["completed"])
-
         overall_percentage = (
-            (total_transferred / total_size * 100) if total_size > 0 else 0
+            (self.total_transferred / self.total_size * 100)
+            if self.total_size > 0
+            else 0
         )
 
-        print(
-            f"⚡ {self.operation_name}: {completed_count}/{len(self.files)} "
+        self.console.print(
+            f"⚡ {self.operation_name}: {self.completed_count}/{len(self.files)} "
             f"files, {overall_percentage:.1f}% overall"
         )
 
@@ -246,19 +487,37 @@ class BatchProgressManager:
 class UploadDownloadDemo:
     """Comprehensive upload/download demonstration"""
 
-    def __init__(self):
+    def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
+        self.email = email
+        self.password = password
         self.sdk: Optional[PCloudSDK] = None
+        self.session: Optional[requests.Session] = None
         self.demo_folder_id: Optional[int] = None
         self.test_files: List[str] = []
+        self.file_sizes: Dict[str, int] = {}
         self.uploaded_files: List[Dict] = []
+        self.download_dir: Optional[str] = None
 
     def setup_sdk(self) -> bool:
         """Setup and authenticate SDK"""
         print("⚡ pCloud SDK Upload/Download Demo")
         print("=" * 50)
 
+        # One keep-alive session for every transfer: parallel batch workers
+        # reuse pooled connections instead of each doing a TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+
         self.sdk = PCloudSDK(
-            location_id=2, token_manager=True, token_file=".pcloud_upload_demo"
+            location_id=2,
+            token_manager=True,
+            token_file=".pcloud_upload_demo",
+            session=self.session,
         )
 
         # Quick authentication
@@ -271,10 +530,17 @@ class UploadDownloadDemo:
             except OSError:
                 pass
 
-        # Need authentication
+        # Need authentication: --email/--password (or PCLOUD_EMAIL /
+        # PCLOUD_PASSWORD) first, interactive prompts only on a terminal
         print("🔐 Authentication required")
-        email = input("⚡ pCloud email: ").strip()
-        password = input("🔒 Password: ").strip()
+        email = self.email or prompt("⚡ pCloud email: ")
+        password = self.password
+        if not password and sys.stdin.isatty():
+            password = getpass.getpass("🔒 Password: ")
+
+        if not email or not password:
+            print("✗ Email and password required (use --email/--password)")
+            return False
 
         try:
             self.sdk.login(email, password)
@@ -294,7 +560,14 @@ class UploadDownloadDemo:
         print(f"✓ Created demo folder: {folder_name} (ID: {self.demo_folder_id})")
 
         # Create test files
-        self.test_files = create_test_files()
+        self.file_sizes = create_test_files()
+        self.test_files = list(self.file_sizes)
+
+        # One download directory for the whole run, created up front; each
+        # demo gets its own subdirectory so same-named files never collide
+        self.download_dir = tempfile.mkdtemp(prefix="pcloud_dl_")
+        for name in ("basic", "batch"):
+            os.mkdir(os.path.join(self.download_dir, name))
 
     def demo_basic_upload(self):
         """Demonstrate basic file upload"""
@@ -308,7 +581,7 @@ class UploadDownloadDemo:
 
         test_file = self.test_files[0]  # Small file
         file_name = os.path.basename(test_file)
-        file_size = os.path.getsize(test_file)
+        file_size = self.file_sizes[test_file]
 
         print(f"⚡ Uploading {file_name} ({format_size(file_size)})...")
 
@@ -318,7 +591,10 @@ class UploadDownloadDemo:
         try:
             start_time = time.time()
             result = self.sdk.file.upload(
-                test_file, self.demo_folder_id, progress_callback=progress
+                test_file,
+                self.demo_folder_id,
+                progress_callback=progress,
+                chunk_size=pick_chunk_size(file_size),
             )
             elapsed = time.time() - start_time
 
@@ -333,7 +609,7 @@ class UploadDownloadDemo:
 
             print(f"✓ Upload completed in {elapsed:.1f}s")
             print(f"   File ID: {file_info['id']}")
-            print(f"   Average speed: {format_speed(file_size / elapsed)}")
+            print(f"   Average speed: {format_speed(safe_rate(file_size, elapsed))}")
 
         except Exception as e:
             print(f"✗ Upload failed: {e}")
@@ -350,7 +626,7 @@ class UploadDownloadDemo:
 
         test_file = self.test_files[2]  # Large file
         file_name = os.path.basename(test_file)
-        file_size = os.path.getsize(test_file)
+        file_size = self.file_sizes[test_file]
 
         print(f"⚡ Advanced upload: {file_name} ({format_size(file_size)})")
 
@@ -358,14 +634,20 @@ class UploadDownloadDemo:
         progress = AdvancedProgressTracker(file_name)
 
         try:
-            # Calculate file hash before upload for verification
-            print("⚡ Calculating file hash for verification...")
-            original_hash = calculate_file_hash(test_file)
-
+            # The hash for verification is computed while uploading, so the
+            # file is only read once; the next chunks are read (and hashed)
+            # by a separate thread while the current one is sent
+            chunk_size = pick_chunk_size(file_size)
             start_time = time.time()
-            result = self.sdk.file.upload(
-                test_file, self.demo_folder_id, progress_callback=progress
-            )
+            with HashingReader(test_file) as reader:
+                with ReadAheadReader(reader, chunk_size) as read_ahead:
+                    result = self.sdk.file.upload(
+                        read_ahead,
+                        self.demo_folder_id,
+                        progress_callback=progress,
+                        chunk_size=chunk_size,
+                    )
+                original_hash = reader.hexdigest()
             elapsed = time.time() - start_time
 
             file_info = {
@@ -390,11 +672,8 @@ class UploadDownloadDemo:
         print("3️⃣ BATCH UPLOAD DEMO")
         print("=" * 60)
 
-        remaining_files = [
-            f
-            for f in self.test_files
-            if f not in [uf["local_path"] for uf in self.uploaded_files]
-        ]
+        uploaded_paths = {uf["local_path"] for uf in self.uploaded_files}
+        remaining_files = [f for f in self.test_files if f not in uploaded_paths]
 
         if not remaining_files:
             print("⚠ No remaining files for batch upload")
@@ -408,33 +687,42 @@ class UploadDownloadDemo:
         # Add files to batch manager
         for file_path in remaining_files:
             file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
-            batch_manager.add_file(file_name, file_size)
-
-        # Upload files sequentially with individual progress tracking
-        for file_path in remaining_files:
-            file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path)
+            batch_manager.add_file(file_name, self.file_sizes[file_path])
+
+        # Upload files in parallel, each with its own progress tracking
+        pool = ThreadPoolExecutor(max_workers=min(8, len(remaining_files)))
+        with batch_manager, pool:
+            futures = {
+                pool.submit(
+                    self.sdk.file.upload,
+                    file_path,
+                    self.demo_folder_id,
+                    progress_callback=batch_manager.create_progress_callback(
+                        os.path.basename(file_path)
+                    ),
+                    chunk_size=pick_chunk_size(self.file_sizes[file_path]),
+                ): file_path
+                for file_path in remaining_files
+            }
 
-            print(f"\n⚡ Uploading {file_name}...")
-            progress_callback = batch_manager.create_progress_callback(file_name)
-
-            try:
-                result = self.sdk.file.upload(
-                    file_path, self.demo_folder_id, progress_callback=progress_callback
-                )
+            # Results are collected here, on the main thread, as they finish
+            for future in as_completed(futures):
+                file_path = futures[future]
+                file_name = os.path.basename(file_path)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    batch_manager.console.print(f"✗ Failed to upload {file_name}: {e}")
+                    continue
 
                 file_info = {
                     "id": result["metadata"]["fileid"],
                     "name": file_name,
-                    "size": file_size,
+                    "size": self.file_sizes[file_path],
                     "local_path": file_path,
                 }
                 self.uploaded_files.append(file_info)
 
-            except Exception as e:
-                print(f"✗ Failed to upload {file_name}: {e}")
-
         print(
             f"\n✓ Batch upload completed: {len(self.uploaded_files)} "
             f"total files uploaded"
@@ -455,18 +743,20 @@ class UploadDownloadDemo:
 
         print(f"⚡ Downloading {file_info['name']} (ID: {file_info['id']})...")
 
-        # Create download directory
-        temp_dir = tempfile.gettempdir()
-        download_dir = os.path.join(temp_dir, "pcloud_downloads")
-        os.makedirs(download_dir, exist_ok=True)
+        download_dir = os.path.join(self.download_dir, "basic")
 
         # Basic download with progress
         progress = create_progress_bar(f"Download: {file_info['name']}")
+        # A full check hashes the chunks as they arrive, not the file after
+        hasher = hashlib.sha256() if VERIFY_MODE == "full" else None
 
         try:
             start_time = time.time()
             success = self.sdk.file.download(
-                file_info["id"], download_dir, progress_callback=progress
+                file_info["id"],
+                download_dir,
+                progress_callback=progress,
+                chunk_callback=hasher.update if hasher else None,
             )
             elapsed = time.time() - start_time
 
@@ -476,27 +766,39 @@ class UploadDownloadDemo:
                     downloaded_size = os.path.getsize(downloaded_file)
                     print(f"✓ Download completed in {elapsed:.1f}s")
                     print(f"   Downloaded size: {format_size(downloaded_size)}")
-                    print(
-                        f"   Average speed: {format_speed(downloaded_size / elapsed)}"
-                    )
+                    speed = safe_rate(downloaded_size, elapsed)
+                    print(f"   Average speed: {format_speed(speed)}")
 
-                    # Verify file integrity if we have original hash
-                    if "original_hash" in file_info:
-                        downloaded_hash = calculate_file_hash(downloaded_file)
-                        if downloaded_hash == file_info["original_hash"]:
-                            print("✓ File integrity verified - hashes match!")
-                        else:
-                            print("⚠ File integrity check failed - hashes don't match")
-
-                    # Cleanup
-                    os.remove(downloaded_file)
+                    self._verify_download(
+                        downloaded_file, downloaded_size, file_info, hasher
+                    )
 
         except Exception as e:
             print(f"✗ Download failed: {e}")
-        finally:
-            # Cleanup download directory
-            if os.path.exists(download_dir):
-                shutil.rmtree(download_dir, ignore_errors=True)
+
+    def _verify_download(self, downloaded_file, downloaded_size, file_info, hasher):
+        """Check a downloaded file against its original, per VERIFY_MODE"""
+        if downloaded_size != file_info["size"]:
+            print("⚠ File integrity check failed - sizes don't match")
+            return
+
+        if VERIFY_MODE == "full":
+            original_hash = file_info.get("original_hash") or calculate_file_hash(
+                file_info["local_path"]
+            )
+            match = hasher.hexdigest() == original_hash
+        elif VERIFY_MODE == "sample":
+            match = calculate_sample_hash(
+                downloaded_file, downloaded_size
+            ) == calculate_sample_hash(file_info["local_path"], file_info["size"])
+        else:
+            print("✓ File size verified (PCLOUD_DEMO_VERIFY=sample|full to hash)")
+            return
+
+        if match:
+            print(f"✓ File integrity verified - {VERIFY_MODE} hashes match!")
+        else:
+            print("⚠ File integrity check failed - hashes don't match")
 
     def demo_batch_download(self):
         """Demonstrate batch download with verification"""
@@ -512,10 +814,7 @@ class UploadDownloadDemo:
 
         print(f"⚡ Batch downloading {len(download_files)} files...")
 
-        # Create download directory
-        temp_dir = tempfile.gettempdir()
-        download_dir = os.path.join(temp_dir, "batch_downloads")
-        os.makedirs(download_dir, exist_ok=True)
+        download_dir = os.path.join(self.download_dir, "batch")
 
         # Setup batch progress manager
         batch_manager = BatchProgressManager("Batch Download")
@@ -524,19 +823,33 @@ class UploadDownloadDemo:
         for file_info in download_files:
             batch_manager.add_file(file_info["name"], file_info["size"])
 
-        # Download files with progress tracking
+        # Download files in parallel with progress tracking
         successful_downloads = 0
 
-        for file_info in download_files:
-            print(f"\n⚡ Downloading {file_info['name']}...")
-            progress_callback = batch_manager.create_progress_callback(
-                file_info["name"]
-            )
+        pool = ThreadPoolExecutor(max_workers=min(16, len(download_files)))
+        with batch_manager, pool:
+            futures = {
+                pool.submit(
+                    self.sdk.file.download,
+                    file_info["id"],
+                    download_dir,
+                    progress_callback=batch_manager.create_progress_callback(
+                        file_info["name"]
+                    ),
+                ): file_info
+                for file_info in download_files
+            }
 
-            try:
-                success = self.sdk.file.download(
-                    file_info["id"], download_dir, progress_callback=progress_callback
-                )
+            # Verified on the main thread as each download finishes
+            for future in as_completed(futures):
+                file_info = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    batch_manager.console.print(
+                        f"✗ Failed to download {file_info['name']}: {e}"
+                    )
+                    continue
 
                 if success:
                     successful_downloads += 1
@@ -546,25 +859,20 @@ class UploadDownloadDemo:
                     if os.path.exists(downloaded_file):
                         downloaded_size = os.path.getsize(downloaded_file)
                         if downloaded_size == file_info["size"]:
-                            print("  ✓ Size verification passed")
+                            batch_manager.console.print(
+                                f"  ✓ {file_info['name']}: size verified"
+                            )
                         else:
-                            print(
-                                f"   ⚠ Size mismatch: expected "
+                            batch_manager.console.print(
+                                f"   ⚠ {file_info['name']}: size mismatch, expected "
                                 f"{file_info['size']}, got {downloaded_size}"
                             )
 
-            except Exception as e:
-                print(f"✗ Failed to download {file_info['name']}: {e}")
-
         print(
             f"\n✓ Batch download completed: "
             f"{successful_downloads}/{len(download_files)} files"
         )
 
-        # Cleanup download directory
-        if os.path.exists(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
-
     def demo_file_operations(self):
         """Demonstrate file operations on uploaded files"""
         print("\n" + "=" * 60)
@@ -635,24 +943,24 @@ class UploadDownloadDemo:
         print("⚡ Upload Performance Analysis:")
         print("-" * 40)
 
-        total_size = 0
-        total_time = 0
-
-        for file_info in self.uploaded_files:
-            if "upload_time" in file_info:
-                size = file_info["size"]
-                time_taken = file_info["upload_time"]
-                speed = size / time_taken if time_taken > 0 else 0
-
-                total_size += size
-                total_time += time_taken
-
-                print(f"⚡ {file_info['name']}:")
-                print(f"   Size: {format_size(size)}")
-                print(f"   Time: {time_taken:.1f}s")
-                print(f"   Speed: {format_speed(speed)}")
-                print()
+        # Batch uploads run in parallel and are not timed individually
+        timed = [f for f in self.uploaded_files if "upload_time" in f]
+
+        report = []
+        for file_info in timed:
+            size = file_info["size"]
+            time_taken = file_info["upload_time"]
+            speed = safe_rate(size, time_taken)
+            report.append(
+                f"⚡ {file_info['name']}:\n"
+                f"   Size: {format_size(size)}\n"
+                f"   Time: {time_taken:.1f}s\n"
+                f"   Speed: {format_speed(speed)}\n"
+            )
+        print("\n".join(report))
 
+        total_size = sum(f["size"] for f in timed)
+        total_time = sum(f["upload_time"] for f in timed)
         if total_time > 0:
             overall_speed = total_size / total_time
             print("⚡ Overall Statistics:")
@@ -672,12 +980,21 @@ class UploadDownloadDemo:
 
             # Clean up local test files
             for test_file in self.test_files:
-                if os.path.exists(test_file):
+                try:
                     os.remove(test_file)
-                    print(f"🗑 Removed local file: {os.path.basename(test_file)}")
+                except FileNotFoundError:
+                    continue
+                print(f"🗑 Removed local file: {os.path.basename(test_file)}")
+
+            # Downloaded files go with the shared download directory
+            if self.download_dir:
+                shutil.rmtree(self.download_dir, ignore_errors=True)
 
         except Exception as e:
             print(f"⚠ Cleanup error: {e}")
+        finally:
+            if self.session:
+                self.session.close()
 
     def run_demo(self):
         """Run the complete upload/download demo"""
@@ -707,8 +1024,21 @@ class UploadDownloadDemo:
             self.cleanup()
 
 
+def parse_args() -> argparse.Namespace:
+    """Command line options for non-interactive runs"""
+    parser = argparse.ArgumentParser(description="pCloud SDK upload/download demo")
+    parser.add_argument("--email", default=os.environ.get("PCLOUD_EMAIL"))
+    parser.add_argument("--password", default=os.environ.get("PCLOUD_PASSWORD"))
+    parser.add_argument(
+        "-y", "--yes", action="store_true", help="Run without confirmation"
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main function"""
+    args = parse_args()
+
     print("🚀 Welcome to the pCloud SDK Upload/Download Demo!")
     print()
     print("This comprehensive demo showcases:")
@@ -720,13 +1050,14 @@ def main():
     print("• Performance analysis and optimization")
     print()
 
-    proceed = input("Continue with the upload/download demo? (y/N): ").strip().lower()
-    if proceed not in ["y", "yes"]:
-        print("Demo cancelled.")
-        return
+    if not args.yes:
+        proceed = prompt("Continue with the upload/download demo? (y/N): ").lower()
+        if proceed not in ["y", "yes"]:
+            print("Demo cancelled.")
+            return
 
     # Run the demo
-    demo = UploadDownloadDemo()
+    demo = UploadDownloadDemo(email=args.email, password=args.password)
     demo.run_demo()
 
 
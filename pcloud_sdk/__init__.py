@@ -3,6 +3,9 @@ pCloud SDK for Python v1.0
 Modern Python SDK for pCloud API with automatic token management and progress tracking
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from .app import App
 from .config import Config
 
@@ -11,20 +14,48 @@ from .core import PCloudSDK
 from .exceptions import PCloudException
 from .file_operations import File
 from .folder_operations import Folder
-from .progress_utils import (
-    DetailedProgress,
-    MinimalProgress,
-    SilentProgress,
-    SimpleProgressBar,
-    create_detailed_progress,
-    create_minimal_progress,
-    create_progress_bar,
-    create_silent_progress,
-)
 from .request import HttpClient, Request
 from .response import Response
 from .user_operations import User
 
+# PCloudSDK itself loads every module above; only the progress helpers are
+# left for first access (PEP 562), so a plain ``import pcloud_sdk`` skips them
+_PROGRESS_NAMES = {
+    "DetailedProgress",
+    "MinimalProgress",
+    "SilentProgress",
+    "SimpleProgressBar",
+    "create_detailed_progress",
+    "create_minimal_progress",
+    "create_progress_bar",
+    "create_silent_progress",
+}
+
+if TYPE_CHECKING:  # Static analysis sees the lazy names as plain imports
+    from .progress_utils import (
+        DetailedProgress,
+        MinimalProgress,
+        SilentProgress,
+        SimpleProgressBar,
+        create_detailed_progress,
+        create_minimal_progress,
+        create_progress_bar,
+        create_silent_progress,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _PROGRESS_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(".progress_utils", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | _PROGRESS_NAMES)
+
+
 # Prefer version generated by setuptools_scm at build time
 try:  # pragma: no cover - exists in sdists/wheels
     from ._version import version as __version__  # type: ignore
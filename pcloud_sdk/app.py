@@ -1,8 +1,9 @@
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from pcloud_sdk.config import Config
 from pcloud_sdk.exceptions import PCloudException
@@ -19,6 +20,8 @@ class App:
         self.location_id = 1  # 1 = USA, 2 = EU
         self.curl_exec_timeout = 3600
         self.auth_type = "oauth2"  # "oauth2" ou "direct"
+        self.session: Optional[requests.Session] = None
+        self._authorize_urls: Dict[Tuple[str, str], str] = {}
 
     def set_app_key(self, app_key: str) -> None:
         """Set App key (Client ID)"""
@@ -73,16 +76,41 @@ class App:
         """Get cURL execution timeout"""
         return self.curl_exec_timeout
 
+    def set_session(self, session: Optional[requests.Session]) -> None:
+        """Set shared HTTP session (reused by all API calls for keep-alive)"""
+        self.session = session
+
+    def get_session(self) -> requests.Session:
+        """Get shared HTTP session, creating a pooled one on first use
+
+        Login requests and every API client built from this app go through
+        the same session, so the TLS connection to pCloud is reused.
+        """
+        if self.session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+            self.session = session
+        return self.session
+
     def get_authorize_code_url(self) -> str:
-        """Build OAuth2 authorization URL"""
+        """Build OAuth2 authorization URL
+
+        The URL only depends on the app key and redirect URI, so it is built
+        once per pair and reused.
+        """
         self._validate_params(["app_key"])
 
-        params = {"client_id": self.app_key, "response_type": "code"}
+        key = (self.app_key, self.redirect_uri)
+        url = self._authorize_urls.get(key)
+        if url is None:
+            params = {"client_id": self.app_key, "response_type": "code"}
 
-        if self.redirect_uri:
-            params["redirect_uri"] = self.redirect_uri
+            if self.redirect_uri:
+                params["redirect_uri"] = self.redirect_uri
 
-        return "https://my.pcloud.com/oauth2/authorize?" + urlencode(params)
+            url = "https://my.pcloud.com/oauth2/authorize?" + urlencode(params)
+            self._authorize_urls[key] = url
+        return url
 
     def get_token_from_code(
         self, code: str, location_id: Union[str, int]
@@ -99,7 +127,7 @@ class App:
         host = Config.get_api_host_by_location_id(int(location_id))
         url = host + "oauth2_token?" + urlencode(params)
 
-        response = requests.get(url, verify=True, timeout=30)
+        response = self.get_session().get(url, verify=True, timeout=30)
 
         if response.headers.get("content-type", "").startswith("application/json"):
             data = response.json()
@@ -142,7 +170,7 @@ class App:
         url = host + "userinfo?" + urlencode(params)
 
         try:
-            response = requests.get(url, verify=True, timeout=30)
+            response = self.get_session().get(url, verify=True, timeout=30)
 
             # Check HTTP status first
             if response.status_code != 200:
@@ -178,6 +206,12 @@ class App:
                     "email": data.get("email", email),
                     "quota": data.get("quota"),
                     "usedquota": data.get("usedquota"),
+                    # Full userinfo payload, minus the token and status
+                    "user_info": {
+                        key: value
+                        for key, value in data.items()
+                        if key not in ("auth", "result")
+                    },
                 }
             else:
                 # Handle specific error codes and messages
@@ -13,10 +13,24 @@ from typing import Any
 try:
     from pcloud_sdk import PCloudException, PCloudSDK
     from pcloud_sdk.progress_utils import create_minimal_progress, create_progress_bar
+    from pcloud_sdk.response import json_loads
 except ImportError:
     print("❌ pCloud SDK not found. Install it with: pip install pcloud-sdk-python")
     sys.exit(1)
 
+# The config is read on every command: use orjson when the [fast] extra is
+# installed, still indented since users may edit it by hand
+try:
+    import orjson
+
+    def _dump_config(config: dict) -> bytes:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover - depends on installed extras
+
+    def _dump_config(config: dict) -> bytes:
+        return json.dumps(config, indent=2).encode("utf-8")
+
 
 class PCloudCLI:
     """CLI Interface for pCloud SDK"""
@@ -29,8 +43,8 @@ class PCloudCLI:
         """Load CLI configuration"""
         if self.config_file.exists():
             try:
-                with open(self.config_file, "r") as f:
-                    return json.load(f)
+                with open(self.config_file, "rb") as f:
+                    return json_loads(f.read())
             except Exception as e:
                 # Log error to stderr instead of ignoring completely
                 import sys
@@ -40,8 +54,8 @@ class PCloudCLI:
     def save_config(self, config: dict) -> None:
         """Save CLI configuration"""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=2)
+            with open(self.config_file, "wb") as f:
+                f.write(_dump_config(config))
         except Exception as e:
             print(f"⚠️ Unable to save config: {e}")
 
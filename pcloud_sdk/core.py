@@ -5,23 +5,65 @@ Converted from the PHP SDK
 This package provides a Python interface to the pCloud API.
 """
 
+import hashlib
+import hmac
 import os
+import threading
 import time
 import warnings
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+import requests
 
 from pcloud_sdk.app import App
 from pcloud_sdk.exceptions import PCloudException
 from pcloud_sdk.file_operations import File
 from pcloud_sdk.folder_operations import Folder
+from pcloud_sdk.response import json_loads
 from pcloud_sdk.user_operations import User
 
+# Credential files are written with orjson too when the [fast] extra is there,
+# as compact JSON: they are read on every start, rarely by a human
+try:
+    import orjson
+
+    def _dump_credentials(credentials: Dict[str, Any]) -> bytes:
+        return orjson.dumps(credentials)
+
+except ImportError:  # pragma: no cover - depends on installed extras
+    import json
+
+    def _dump_credentials(credentials: Dict[str, Any]) -> bytes:
+        return json.dumps(credentials, separators=(",", ":")).encode("utf-8")
+
+
+# Direct-login tokens shared by every PCloudSDK instance of the process,
+# keyed by (email, location_id); logins and logouts of several threads
+# go through _token_cache_lock
+_token_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+_token_cache_lock = threading.Lock()
+
+# Cached tokens are not reused this many seconds before they would go stale
+_TOKEN_EXPIRY_SKEW = 60
+
+
+def _credentials_digest(email: str, password: str) -> str:
+    """Digest used to check a cached token against the given password"""
+    return hashlib.sha256(f"{email}\0{password}".encode("utf-8")).hexdigest()
+
 
 class PCloudSDK:
     """
     Convenient wrapper class for the pCloud SDK with integrated token management
     """
 
+    # Shared instances handed out by get_or_create(), with the arguments
+    # each one was created with
+    _instances: ClassVar[
+        Dict[Tuple[str, int, str], Tuple["PCloudSDK", str, Dict[str, Any]]]
+    ] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(  # nosec B107 - empty string defaults are not hardcoded passwords
         self,
         app_key: str = "",
@@ -32,6 +74,7 @@ class PCloudSDK:
         token_manager: bool = True,
         token_file: str = ".pcloud_credentials",
         token_staleness_days: int = 30,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the pCloud SDK
@@ -50,12 +93,15 @@ class PCloudSDK:
                 .pcloud_credentials)
             token_staleness_days: Number of days after which saved credentials
                 are considered stale (default 30)
+            session: Shared requests.Session used for every API call, so
+                connections are kept alive and pooled (optional)
         """
         self.app = App()
         self.app.set_app_key(app_key)
         self.app.set_app_secret(app_secret)
         self.app.set_location_id(location_id)
         self.app.auth_type = auth_type
+        self.app.set_session(session)
 
         # Token management
         self.token_manager_enabled = token_manager
@@ -73,10 +119,67 @@ class PCloudSDK:
         self._folder = None
         self._file = None
 
+    @classmethod
+    def get_or_create(
+        cls,
+        app_key: str = "",
+        app_secret: str = "",
+        location_id: int = 2,
+        **kwargs: Any,
+    ) -> "PCloudSDK":
+        """
+        Get the process-wide instance for an app, creating it on first use
+
+        Instances are shared per (app_key, location_id, token_file), so code
+        that needs an SDK on every request (e.g. web handlers) keeps the same
+        connection pool and loaded credentials. Asking again with a
+        different secret or other constructor arguments raises instead of
+        silently returning an instance configured for someone else.
+
+        The instance holds one set of credentials: per-user flows (such as
+        an OAuth2 code exchange for each user) need their own PCloudSDK.
+
+        Args:
+            app_key: Your pCloud app key (Client ID)
+            app_secret: Your pCloud app secret (Client Secret)
+            location_id: Server location (1=US, 2=EU)
+            **kwargs: Other PCloudSDK constructor arguments
+
+        Returns:
+            PCloudSDK: The shared instance
+
+        Raises:
+            PCloudException: If the instance exists with other arguments
+        """
+        key = (app_key, location_id, kwargs.get("token_file", ".pcloud_credentials"))
+        with cls._instances_lock:
+            entry = cls._instances.get(key)
+            if entry is None:
+                sdk = cls(app_key, app_secret, location_id=location_id, **kwargs)
+                cls._instances[key] = (sdk, app_secret, kwargs)
+                return sdk
+
+        sdk, created_secret, created_kwargs = entry
+        if created_secret != app_secret or created_kwargs != kwargs:
+            raise PCloudException(
+                f"A shared PCloudSDK for app '{app_key}' already exists with "
+                "different arguments"
+            )
+        return sdk
+
     def _save_credentials(
-        self, email: str, token: str, location_id: int, user_info: Optional[Dict] = None
+        self,
+        email: str,
+        token: str,
+        location_id: int,
+        user_info: Optional[Dict] = None,
+        saved_at: Optional[float] = None,
     ) -> None:
-        """Save credentials to file if token manager is enabled"""
+        """Save credentials to file if token manager is enabled
+
+        saved_at is when the token was obtained (default now): a token reused
+        from the in-process cache keeps its age for the staleness check.
+        """
         if not self.token_manager_enabled:
             return
 
@@ -86,14 +189,24 @@ class PCloudSDK:
             "location_id": location_id,
             "auth_type": self.app.get_auth_type(),
             "user_info": user_info or {},
-            "saved_at": time.time(),
+            "saved_at": time.time() if saved_at is None else saved_at,
         }
 
+        # Written owner-only to a sibling then renamed over the old file, so a
+        # crash never leaves truncated credentials behind
+        tmp_file = f"{self.token_file}.tmp"
         try:
-            import json
-
-            with open(self.token_file, "w") as f:
-                json.dump(credentials, f, indent=2)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_dump_credentials(credentials))
+                os.replace(tmp_file, self.token_file)
+            except BaseException:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+                raise
             print(f"✅ Credentials saved in {self.token_file}")
             # Update internal state only if write was successful
             self._saved_credentials = credentials
@@ -104,14 +217,13 @@ class PCloudSDK:
 
     def _load_saved_credentials(self) -> bool:
         """Load credentials from file if available"""
-        if not self.token_manager_enabled or not os.path.exists(self.token_file):
+        # A missing file is handled by FileNotFoundError below, no stat needed
+        if not self.token_manager_enabled:
             return False
 
         try:
-            import json
-
-            with open(self.token_file, "r") as f:
-                credentials = json.load(f)
+            with open(self.token_file, "rb") as f:
+                credentials = json_loads(f.read())
 
             # Check if credentials are valid (not too old)
             saved_at = credentials.get("saved_at", 0)
@@ -155,7 +267,7 @@ class PCloudSDK:
         except (IOError, OSError) as e:
             print(f"⚠️ Could not read credentials from {self.token_file}: {e}")
             return False
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json / orjson JSONDecodeError
             print(f"⚠️ Error decoding JSON from {self.token_file}: {e}")
             return False
 
@@ -306,23 +418,63 @@ class PCloudSDK:
             elif not email:
                 raise PCloudException("Email and password required for first login")
 
+        # Reuse a token obtained by another instance of this process
+        cache_key = (email.strip(), int(location_id))
+        digest = _credentials_digest(cache_key[0], password)
+        # Checked against this instance's own staleness limit: the entry may
+        # come from an instance allowing older tokens
+        max_age = self.token_staleness_days * 24 * 3600 - _TOKEN_EXPIRY_SKEW
+        with _token_cache_lock:
+            cached = _token_cache.get(cache_key)
+        if cached and time.time() - cached["issued_at"] >= max_age:
+            # Past the staleness limit: log in again rather than trust it
+            cached = None
+        if not force_login and cached and hmac.compare_digest(cached["digest"], digest):
+            login_info = dict(cached["login_info"])
+            self.app.set_access_token(login_info["access_token"], "direct")
+            self.app.set_location_id(login_info["locationid"])
+            self._user = User(self.app, login_info.get("user_info"))
+            self._save_login(login_info, saved_at=cached["issued_at"])
+            return login_info
+
         print(f"🔐 New connection for {email}...")
         login_info = self.app.login_with_credentials(email, password, location_id)
+        # The login response already is a full userinfo payload
+        user_info = login_info.get("user_info")
+        self._user = User(self.app, user_info)
+
+        issued_at = time.time()
+        self._save_login(login_info, saved_at=issued_at)
+
+        with _token_cache_lock:
+            _token_cache[cache_key] = {
+                "digest": digest,
+                "login_info": dict(login_info),
+                "issued_at": issued_at,
+            }
+        return login_info
 
-        # Save credentials if token manager is enabled
-        if self.token_manager_enabled:
-            try:
-                user_info = self.user.get_user_info()
-                self._save_credentials(
-                    email=login_info["email"],
-                    token=login_info["access_token"],
-                    location_id=login_info["locationid"],
-                    user_info=user_info,
-                )
-            except Exception as e:
-                print(f"⚠️ Could not save credentials: {e}")
+    def _save_login(self, login_info: Dict[str, Any], saved_at: float) -> None:
+        """Save the credentials of a login, warning instead of failing it"""
+        if not self.token_manager_enabled:
+            return
+        try:
+            self._save_credentials(
+                email=login_info["email"],
+                token=login_info["access_token"],
+                location_id=login_info["locationid"],
+                user_info=login_info.get("user_info"),
+                saved_at=saved_at,
+            )
+        except Exception as e:
+            print(f"⚠️ Could not save credentials: {e}")
 
-        return login_info
+    @staticmethod
+    def invalidate_cached_token(email: str) -> None:
+        """Forget the in-process tokens cached for an email"""
+        with _token_cache_lock:
+            for key in [key for key in _token_cache if key[0] == email.strip()]:
+                del _token_cache[key]
 
     def login_or_load(  # nosec B107 - empty string defaults are not hardcoded passwords
         self,
@@ -379,6 +531,11 @@ class PCloudSDK:
 
     def logout(self) -> None:
         """Logout and clear credentials"""
+        token = self.app.get_access_token()
+        with _token_cache_lock:
+            for key, cached in list(_token_cache.items()):
+                if cached["login_info"]["access_token"] == token:
+                    del _token_cache[key]
         self.clear_saved_credentials()
         self.app.set_access_token("", "direct")
         self._user = None
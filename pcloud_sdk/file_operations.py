@@ -1,10 +1,21 @@
+import io
 import os
+import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
 from urllib.parse import unquote
 
-import requests
-
 from pcloud_sdk.app import App
 from pcloud_sdk.config import Config
 from pcloud_sdk.exceptions import PCloudException
@@ -42,8 +53,15 @@ class File:
         file_id: int,
         destination: str = "",
         progress_callback: Optional[Callable] = None,
+        chunk_callback: Optional[Callable[[bytes], Any]] = None,
+        chunk_size: Optional[int] = None,
     ) -> bool:
-        """Download file to local destination"""
+        """Download file to local destination
+
+        ``chunk_callback`` is called with every chunk as it is written, e.g.
+        ``hasher.update`` to verify the file without reading it back from disk.
+        ``chunk_size`` overrides ``part_size`` for this download.
+        """
         file_link = self.get_link(file_id)
 
         if destination:
@@ -58,14 +76,16 @@ class File:
         filename = unquote(file_link.split("/")[-1])
         file_path = destination + filename
 
-        # Download file in chunks
-        response = requests.get(file_link, stream=True, verify=True, timeout=300)
+        # Download file in chunks (reuse the API session's connection pool)
+        response = self.request.http_client.session.get(
+            file_link, stream=True, verify=True, timeout=300
+        )
         response.raise_for_status()
 
         # Get file size from headers
         total_size = int(response.headers.get("content-length", 0))
         downloaded_bytes = 0
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Initialize progress callback
         if progress_callback:
@@ -81,14 +101,16 @@ class File:
 
         temp_path = file_path + ".download"
         with open(temp_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=self.part_size):
+            for chunk in response.iter_content(chunk_size=chunk_size or self.part_size):
                 if chunk:
                     f.write(chunk)
+                    if chunk_callback:
+                        chunk_callback(chunk)
                     downloaded_bytes += len(chunk)
 
                     # Update progress
                     if progress_callback and total_size > 0:
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         speed = downloaded_bytes / elapsed if elapsed > 0 else 0
                         percentage = (downloaded_bytes / total_size) * 100
                         progress_callback(
@@ -102,7 +124,7 @@ class File:
 
         # Final progress update
         if progress_callback:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             speed = downloaded_bytes / elapsed if elapsed > 0 else 0
             progress_callback(
                 downloaded_bytes,
@@ -120,17 +142,34 @@ class File:
 
     def upload(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         folder_id: int = 0,
         filename: Optional[str] = None,
         progress_callback: Optional[Callable] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Upload file to pCloud"""
-        if not os.path.exists(file_path) or not os.path.isfile(file_path):
-            raise PCloudException("Invalid file")
-
-        if not filename:
-            filename = os.path.basename(file_path)
+        """Upload file to pCloud
+
+        ``file_path`` may also be an open binary file object, which is streamed
+        from its current position without being reopened. ``chunk_size``
+        overrides ``part_size`` for this upload: each chunk is one
+        ``upload_write`` request.
+        """
+        is_path = isinstance(file_path, (str, os.PathLike))
+        if is_path:
+            if not os.path.exists(file_path) or not os.path.isfile(file_path):
+                raise PCloudException("Invalid file")
+            if not filename:
+                filename = os.path.basename(file_path)
+            file_size = os.path.getsize(file_path)
+        else:
+            # .name is an int for fd-backed objects (open(fd), os.fdopen)
+            name = getattr(file_path, "name", None)
+            if not filename and isinstance(name, (str, os.PathLike)):
+                filename = os.path.basename(name)
+            if not filename:
+                raise PCloudException("Please provide a filename for file objects")
+            file_size = self._remaining_size(file_path)
 
         print(f"🔄 Démarrage de l'upload: {filename}")
 
@@ -145,9 +184,8 @@ class File:
             )
 
         # Upload file in chunks
-        file_size = os.path.getsize(file_path)
         uploaded_bytes = 0
-        start_time = time.time()
+        start_time = time.monotonic()
 
         params = {"uploadid": upload_id, "uploadoffset": 0}
 
@@ -165,9 +203,14 @@ class File:
         else:
             print(f"📤 Upload en cours... ({file_size:,} bytes)")
 
-        with open(file_path, "rb") as f:
+        source: ContextManager[BinaryIO] = (
+            open(file_path, "rb") if is_path else nullcontext(file_path)
+        )
+        with source as f:
+            if is_path:
+                self._advise_sequential(f)
             while True:
-                chunk = f.read(self.part_size)
+                chunk = f.read(chunk_size or self.part_size)
                 if not chunk:
                     break
 
@@ -180,7 +223,7 @@ class File:
                         params["uploadoffset"] = uploaded_bytes
 
                         # Progress update
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         speed = uploaded_bytes / elapsed if elapsed > 0 else 0
                         percentage = (uploaded_bytes / file_size) * 100
 
@@ -226,7 +269,7 @@ class File:
 
         # Update progress for saving phase
         if progress_callback:
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             speed = uploaded_bytes / elapsed if elapsed > 0 else 0
             progress_callback(
                 uploaded_bytes,
@@ -246,7 +289,7 @@ class File:
 
             # Final progress update
             if progress_callback:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 speed = uploaded_bytes / elapsed if elapsed > 0 else 0
                 progress_callback(
                     uploaded_bytes,
@@ -262,7 +305,7 @@ class File:
             return result
         except Exception as e:
             if progress_callback:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 speed = uploaded_bytes / elapsed if elapsed > 0 else 0
                 progress_callback(
                     uploaded_bytes,
@@ -276,6 +319,55 @@ class File:
                 )
             raise PCloudException(f"Error during save: {e}")
 
+    def upload_many(self, file_paths: List[str], folder_id: int = 0) -> Dict[str, Any]:
+        """Upload several files in a single multipart request
+
+        Meant for batches of small files, where one ``uploadfile`` call avoids
+        the three round-trips per file of the chunked ``upload()``.
+        """
+        if not file_paths:
+            raise PCloudException("Please provide at least one file")
+        for file_path in file_paths:
+            if not os.path.isfile(file_path):
+                raise PCloudException(f"Invalid file: {file_path}")
+
+        files = [
+            (f"file{index}", file_path) for index, file_path in enumerate(file_paths, 1)
+        ]
+        return self.request.post("uploadfile", {"folderid": folder_id}, files)
+
+    def upload_batch(
+        self,
+        file_paths: List[str],
+        folder_id: int = 0,
+        max_workers: int = 4,
+        progress_callback: Optional[Callable] = None,
+    ) -> List[Dict[str, Any]]:
+        """Upload several files in parallel with the chunked ``upload()``
+
+        Results are returned in the order of ``file_paths``. The progress
+        callback is shared by all workers, so calls to it are serialized; use
+        its ``filename`` keyword to tell the files apart.
+        """
+        callback: Optional[Callable] = None
+        if progress_callback:
+            lock = threading.Lock()
+
+            def serialized_callback(*args: Any, **kwargs: Any) -> None:
+                with lock:
+                    progress_callback(*args, **kwargs)
+
+            callback = serialized_callback
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.upload, file_path, folder_id, progress_callback=callback
+                )
+                for file_path in file_paths
+            ]
+            return [future.result() for future in futures]
+
     def delete(self, file_id: int) -> Dict[str, Any]:
         """Delete file"""
         response = self.request.get("deletefile", {"fileid": file_id})
@@ -341,6 +433,30 @@ class File:
             else:
                 raise e
 
+    @staticmethod
+    def _advise_sequential(fileobj: BinaryIO) -> None:
+        """Tell the kernel the file is read once, front to back
+
+        Uploads go over HTTPS, so sendfile() can't hand the file to the socket;
+        a larger read-ahead at least keeps the disk ahead of the network.
+        """
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _remaining_size(fileobj: BinaryIO) -> int:
+        """Number of bytes left to read from a file object"""
+        position = fileobj.tell()
+        try:
+            return os.fstat(fileobj.fileno()).st_size - position
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(position)
+            return end - position
+
     def _write(self, content: bytes, params: Dict[str, Any]) -> None:
         """Write content chunk during upload"""
         try:
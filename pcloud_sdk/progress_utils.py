@@ -4,9 +4,14 @@ Utilitaires pour le suivi de progression des uploads/downloads pCloud
 Classes helper prêtes à l'emploi
 """
 
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import IO, Any, Callable, Dict, MutableSequence, Optional, Set
+
+# Granularité par défaut des barres créées via create_progress_bar
+PROGRESS_BAR_MIN_BYTES = 256 * 1024
 
 
 class SimpleProgressBar:
@@ -18,6 +23,7 @@ class SimpleProgressBar:
         width: int = 50,
         show_speed: bool = True,
         show_eta: bool = True,
+        min_bytes: int = 0,
     ):
         """
         Args:
@@ -25,13 +31,16 @@ class SimpleProgressBar:
             width: Largeur de la barre de progression
             show_speed: Afficher la vitesse de transfert
             show_eta: Afficher le temps estimé restant
+            min_bytes: Nombre minimal d'octets entre deux rafraîchissements
         """
         self.title = title
         self.width = width
         self.show_speed = show_speed
         self.show_eta = show_eta
+        self.min_bytes = min_bytes
         self.start_time: Optional[float] = None
         self.last_update: float = 0.0
+        self.last_bytes: int = 0
 
     def __call__(
         self,
@@ -47,11 +56,16 @@ class SimpleProgressBar:
             self.start_time = time.time()
             print(f"\n{self.title}: {kwargs.get('filename', 'file')}")
 
+        # Agréger les petits callbacks avant de redessiner
+        if bytes_transferred - self.last_bytes < self.min_bytes and percentage < 100:
+            return
+
         # Limiter les updates pour éviter le flickering
         now = time.time()
         if now - self.last_update < 0.1 and percentage < 100:
             return
         self.last_update = now
+        self.last_bytes = bytes_transferred
 
         # Créer la barre
         filled = int(self.width * percentage / 100)
@@ -99,14 +113,20 @@ class SimpleProgressBar:
 class DetailedProgress:
     """Affichage détaillé de la progression avec logs"""
 
-    def __init__(self, log_file: Optional[str] = None):
+    def __init__(
+        self, log_file: Optional[str] = None, max_checkpoints: Optional[int] = None
+    ):
         """
         Args:
             log_file: Fichier de log optionnel pour sauvegarder la progression
+            max_checkpoints: Si défini, ne garder que les N derniers checkpoints
+                (mémoire bornée pour les longs transferts)
         """
         self.log_file = log_file
         self.start_time: Optional[float] = None
-        self.checkpoints: List[Dict[str, Any]] = []
+        self.checkpoints: MutableSequence[Dict[str, Any]] = (
+            deque(maxlen=max_checkpoints) if max_checkpoints else []
+        )
 
     def __call__(
         self,
@@ -235,9 +255,20 @@ class MinimalProgress:
 class SilentProgress:
     """Progression silencieuse - pour logging uniquement"""
 
-    def __init__(self, log_file: str):
+    def __init__(self, log_file: str, buffer_size: int = 0):
+        """
+        Args:
+            log_file: Fichier CSV de destination
+            buffer_size: Si > 0, garder le fichier ouvert avec un tampon de
+                cette taille au lieu de le rouvrir à chaque callback. Le
+                tampon est vidé à la fin du transfert (completed/error) et
+                par close().
+        """
         self.log_file = log_file
+        self.buffer_size = buffer_size
         self.start_time: Optional[float] = None
+        self._handle: Optional[IO[str]] = None
+        self._lock = threading.Lock()
 
         # Créer/vider le fichier de log
         with open(self.log_file, "w", encoding="utf-8") as f:
@@ -272,23 +303,47 @@ class SilentProgress:
         )
 
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(log_line)
+            if self.buffer_size > 0:
+                self._write_buffered(log_line, status in ("completed", "error"))
+            else:
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write(log_line)
         except Exception as e:
             # Log to stderr instead of ignoring completely
             import sys
             print(f"Warning: Failed to write to CSV log file {self.log_file}: {e}", file=sys.stderr)
 
+    def _write_buffered(self, log_line: str, flush: bool) -> None:
+        """Écrire via le fichier gardé ouvert, vidé en fin de transfert"""
+        with self._lock:
+            if self._handle is None:
+                self._handle = open(
+                    self.log_file, "a", buffering=self.buffer_size, encoding="utf-8"
+                )
+            self._handle.write(log_line)
+            if flush:
+                self._handle.flush()
+
+    def close(self) -> None:
+        """Vider et fermer le fichier de log s'il est gardé ouvert"""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
 
 # Factory functions pour création rapide
 def create_progress_bar(title: str = "Transfer", **kwargs: Any) -> SimpleProgressBar:
-    """Créer une barre de progression simple"""
+    """Créer une barre de progression simple (rafraîchie au plus tous les 256KB)"""
+    kwargs.setdefault("min_bytes", PROGRESS_BAR_MIN_BYTES)
     return SimpleProgressBar(title=title, **kwargs)
 
 
-def create_detailed_progress(log_file: Optional[str] = None) -> DetailedProgress:
+def create_detailed_progress(
+    log_file: Optional[str] = None, max_checkpoints: Optional[int] = None
+) -> DetailedProgress:
     """Créer un tracker de progression détaillé"""
-    return DetailedProgress(log_file=log_file)
+    return DetailedProgress(log_file=log_file, max_checkpoints=max_checkpoints)
 
 
 def create_minimal_progress() -> MinimalProgress:
@@ -296,9 +351,9 @@ def create_minimal_progress() -> MinimalProgress:
     return MinimalProgress()
 
 
-def create_silent_progress(log_file: str) -> SilentProgress:
+def create_silent_progress(log_file: str, buffer_size: int = 0) -> SilentProgress:
     """Créer un tracker silencieux avec log"""
-    return SilentProgress(log_file)
+    return SilentProgress(log_file, buffer_size=buffer_size)
 
 
 # Exemples d'utilisation rapide
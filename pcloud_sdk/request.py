@@ -1,9 +1,23 @@
+import io
+import os
 import time
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlencode
 
 import requests
 import urllib3
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
 
 from pcloud_sdk.config import Config
 from pcloud_sdk.exceptions import PCloudException
@@ -19,8 +33,8 @@ if TYPE_CHECKING:
 class HttpClient:
     """HTTP client with retry logic"""
 
-    def __init__(self, timeout: int = 3600):
-        self.session = requests.Session()
+    def __init__(self, timeout: int = 3600, session: Optional[requests.Session] = None):
+        self.session = session if session is not None else requests.Session()
         self.timeout = timeout
         self.session.headers.update({"User-Agent": "pCloud Python SDK"})
 
@@ -34,10 +48,13 @@ class HttpClient:
         # Retry logic (up to 4 attempts)
         for attempt in range(4):
             try:
+                if attempt and hasattr(kwargs.get("data"), "seek"):
+                    kwargs["data"].seek(0)  # Resend streamed bodies from the start
                 response = self.session.request(method, url, **kwargs)
                 if response.status_code == 200:
+                    # Raw bytes: the JSON parser decodes UTF-8 itself
                     return Response(
-                        response.text,
+                        response.content,
                         response.status_code,
                         response.headers.get("content-type", ""),
                     )
@@ -49,6 +66,81 @@ class HttpClient:
         raise PCloudException("Connection lost!")
 
 
+class MultipartBody:
+    """multipart/form-data body that streams its files from disk
+
+    requests reads every part of ``files=`` into memory before sending; this
+    body reads the files chunk by chunk as the connection consumes it, so
+    memory use does not depend on the file sizes.
+    """
+
+    def __init__(self, fields: Dict[str, Any], files: List[Tuple[str, str]]):
+        boundary = choose_boundary()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+        # bytes are sent as is, str parts are paths of files to stream
+        self._parts: List[Union[bytes, str]] = []
+        for name, value in fields.items():
+            field = RequestField(name, str(value))
+            field.make_multipart()
+            self._parts.append(
+                f"--{boundary}\r\n{field.render_headers()}{value}\r\n".encode()
+            )
+        for name, file_path in files:
+            field = RequestField(name, b"", filename=os.path.basename(file_path))
+            field.make_multipart(content_type="application/octet-stream")
+            self._parts.append(f"--{boundary}\r\n{field.render_headers()}".encode())
+            self._parts.append(file_path)
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{boundary}--\r\n".encode())
+
+        self._length = sum(
+            len(part) if isinstance(part, bytes) else os.path.getsize(part)
+            for part in self._parts
+        )
+        self._current: Optional[IO[bytes]] = None
+        self.seek(0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(lambda: self.read(io.DEFAULT_BUFFER_SIZE), b"")
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Rewind the body (only seeking back to the start is supported)"""
+        if offset or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("MultipartBody can only be rewound")
+        self.close()
+        self._pending = iter(self._parts)
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while size:
+            if self._current is None:
+                part = next(self._pending, None)
+                if part is None:
+                    break
+                if isinstance(part, bytes):
+                    self._current = io.BytesIO(part)
+                else:
+                    self._current = open(part, "rb")
+            chunk = self._current.read(size)
+            if not chunk:
+                self.close()
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+
 class Request:
     """Request handler for API calls"""
 
@@ -70,7 +162,9 @@ class Request:
             # Pas de token
             self.global_params = {}
 
-        self.http_client = HttpClient(app.get_curl_execution_timeout())
+        self.http_client = HttpClient(
+            app.get_curl_execution_timeout(), app.get_session()
+        )
 
     def get(
         self, method: str, params: Optional[Dict[str, Any]] = None
@@ -84,14 +178,31 @@ class Request:
         return response.get()
 
     def post(
-        self, method: str, params: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        files: Optional[List[Tuple[str, str]]] = None,
     ) -> Dict[str, Any]:
-        """Execute POST request"""
+        """Execute POST request
+
+        ``files`` is a list of ``(field name, file path)``; when given, the
+        request is a multipart upload streamed from disk.
+        """
         if params is None:
             params = {}
 
         url = self._prepare_url(method, self.global_params)
-        response = self.http_client.request("POST", url, data=params)
+        if not files:
+            response = self.http_client.request("POST", url, data=params)
+            return response.get()
+
+        body = MultipartBody(params, files)
+        try:
+            response = self.http_client.request(
+                "POST", url, data=body, headers={"Content-Type": body.content_type}
+            )
+        finally:
+            body.close()
         return response.get()
 
     def put(
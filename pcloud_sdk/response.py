@@ -3,6 +3,15 @@ from typing import Any, Dict
 
 from pcloud_sdk.exceptions import PCloudException
 
+# Use orjson when available (pip install pcloud-sdk-python[fast]): it parses
+# large folder listings several times faster than the stdlib json module
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    json_loads = json.loads
+
 
 class Response:
     """Class to handle API responses"""
@@ -16,12 +25,12 @@ class Response:
     def _parse_json(self) -> None:
         """Parse JSON response if content type is JSON"""
         if (
-            isinstance(self.response_data, str)
+            isinstance(self.response_data, (str, bytes))
             and "application/json" in self.content_type
         ):
             try:
-                self.response_data = json.loads(self.response_data)
-            except json.JSONDecodeError:
+                self.response_data = json_loads(self.response_data)
+            except ValueError:  # json / orjson JSONDecodeError
                 pass
 
     def get(self) -> Dict[str, Any]:
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pcloud_sdk.app import App
 from pcloud_sdk.request import Request
@@ -7,12 +7,20 @@ from pcloud_sdk.request import Request
 class User:
     """User class for user information"""
 
-    def __init__(self, app: App):
+    def __init__(self, app: App, user_info: Optional[Dict[str, Any]] = None):
         self.request = Request(app)
+        # A userinfo payload the caller already has (e.g. from login) saves a call
+        if user_info is None:
+            user_info = self.request.get("userinfo")
+        self.user_info = user_info
+
+    def refresh(self) -> Dict[str, Any]:
+        """Re-fetch user info from the API, replacing the cached copy"""
         self.user_info = self.request.get("userinfo")
+        return self.user_info
 
     def get_user_info(self) -> Dict[str, Any]:
-        """Get full user info"""
+        """Get full user info (cached, see refresh())"""
         return self.user_info
 
     def get_user_id(self) -> int:
@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures for the pCloud SDK tests
+"""
+
+import pytest
+
+from pcloud_sdk import core
+
+
+@pytest.fixture(autouse=True)
+def reset_process_state():
+    """Keep process-wide SDK state (login tokens, shared instances) per test"""
+    core._token_cache.clear()
+    core.PCloudSDK._instances.clear()
+    yield
+    core._token_cache.clear()
+    core.PCloudSDK._instances.clear()
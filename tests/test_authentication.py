@@ -201,6 +201,14 @@ class TestOAuth2Authentication:
         assert "response_type=code" in auth_url
         assert "redirect_uri" not in auth_url
 
+    def test_get_authorize_url_cached(self):
+        """Test the authorization URL is reused until its inputs change"""
+        first_url = self.app.get_authorize_code_url()
+        assert self.app.get_authorize_code_url() is first_url
+
+        self.app.set_redirect_uri("http://localhost:9090/callback")
+        assert "9090" in self.app.get_authorize_code_url()
+
     def test_missing_app_key_for_oauth(self):
         """Test OAuth2 URL generation without app key"""
         self.app.set_app_key("")
@@ -678,6 +686,203 @@ class TestSDKAuthentication:
         assert sdk.is_authenticated() is True
         assert os.path.exists(self.token_file)  # Check if credentials were saved
 
+    def test_sdk_get_or_create_shares_instances(self):
+        """Test get_or_create returns one instance per app, location and file"""
+        sdk = PCloudSDK.get_or_create(
+            "app_key", "app_secret", token_file=self.token_file
+        )
+
+        assert (
+            PCloudSDK.get_or_create("app_key", "app_secret", token_file=self.token_file)
+            is sdk
+        )
+        assert (
+            PCloudSDK.get_or_create(
+                "app_key", "app_secret", location_id=1, token_file=self.token_file
+            )
+            is not sdk
+        )
+        assert sdk.app.get_app_key() == "app_key"
+
+    def test_sdk_get_or_create_rejects_other_arguments(self):
+        """Test get_or_create never hands out an instance built differently"""
+        PCloudSDK.get_or_create("app_key", "app_secret", token_file=self.token_file)
+
+        with pytest.raises(PCloudException, match="different arguments"):
+            PCloudSDK.get_or_create(
+                "app_key", "other_secret", token_file=self.token_file
+            )
+        with pytest.raises(PCloudException, match="different arguments"):
+            PCloudSDK.get_or_create(
+                "app_key",
+                "app_secret",
+                token_file=self.token_file,
+                auth_type="oauth2",
+            )
+
+    def test_sdk_shared_session(self):
+        """Test that an injected session is shared by all operation classes"""
+        session = requests.Session()
+        sdk = PCloudSDK(access_token="test_token", token_manager=False, session=session)
+
+        assert sdk.app.get_session() is session
+        assert sdk.folder.request.http_client.session is session
+        assert sdk.file.request.http_client.session is session
+
+    def test_sdk_default_session_shared(self):
+        """Test that login and API calls share one session by default"""
+        sdk = PCloudSDK(access_token="test_token", token_manager=False)
+
+        session = sdk.app.get_session()
+        assert isinstance(session, requests.Session)
+        assert sdk.folder.request.http_client.session is session
+        assert sdk.file.request.http_client.session is session
+
+    @responses.activate
+    def test_sdk_user_info_cached_until_refresh(self):
+        """Test that user info is fetched once and re-fetched on refresh()"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 0, "email": "test@example.com", "usedquota": 1},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 0, "email": "test@example.com", "usedquota": 2},
+            status=200,
+        )
+
+        sdk = PCloudSDK(access_token="test_token", token_manager=False)
+
+        assert sdk.user.get_used_quota() == 1
+        assert sdk.user.get_user_info()["usedquota"] == 1
+        assert len(responses.calls) == 1
+
+        sdk.user.refresh()
+        assert sdk.user.get_used_quota() == 2
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_sdk_login_reuses_login_user_info(self):
+        """Test that login seeds the user info instead of fetching it again"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={
+                "result": 0,
+                "auth": "test_token_123",
+                "userid": 12345,
+                "email": "test@example.com",
+                "quota": 10737418240,
+                "usedquota": 1073741824,
+                "publiclinkquota": 53687091200,
+            },
+            status=200,
+        )
+
+        sdk = PCloudSDK(token_file=self.token_file)
+        sdk.login("test@example.com", "test_password", location_id=2)
+
+        assert sdk.user.get_public_link_quota() == 53687091200
+        assert "auth" not in sdk.user.get_user_info()
+        assert len(responses.calls) == 1
+
+        with open(self.token_file) as f:
+            assert json.load(f)["user_info"]["userid"] == 12345
+
+    @responses.activate
+    def test_sdk_login_token_cached_in_process(self):
+        """Test that a second SDK instance reuses the token without a login"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 0, "auth": "cached_token", "email": "cached@example.com"},
+            status=200,
+        )
+
+        first = PCloudSDK(token_manager=False)
+        first.login("cached@example.com", "secret", location_id=2)
+        second = PCloudSDK(token_manager=False)
+        login_info = second.login("cached@example.com", "secret", location_id=2)
+
+        assert login_info["access_token"] == "cached_token"
+        assert second.app.get_access_token() == "cached_token"
+        assert len(responses.calls) == 1
+
+        # A wrong password never gets the cached token
+        responses.replace(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 2000, "error": "Log in failed."},
+            status=200,
+        )
+        with pytest.raises(PCloudException):
+            PCloudSDK(token_manager=False).login(
+                "cached@example.com", "wrong", location_id=2
+            )
+
+        PCloudSDK.invalidate_cached_token("cached@example.com")
+        with pytest.raises(PCloudException):
+            PCloudSDK(token_manager=False).login(
+                "cached@example.com", "secret", location_id=2
+            )
+
+    @responses.activate
+    def test_sdk_login_cached_token_keeps_saved_at(self):
+        """Test that a cache hit saves the token with its original age"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 0, "auth": "cached_token", "email": "cached@example.com"},
+            status=200,
+        )
+
+        PCloudSDK(token_file=self.token_file).login(
+            "cached@example.com", "secret", location_id=2
+        )
+        with open(self.token_file) as f:
+            saved_at = json.load(f)["saved_at"]
+        os.remove(self.token_file)
+
+        with patch("time.time", return_value=saved_at + 3600):
+            PCloudSDK(token_file=self.token_file).login(
+                "cached@example.com", "secret", location_id=2
+            )
+
+        assert len(responses.calls) == 1
+        with open(self.token_file) as f:
+            assert json.load(f)["saved_at"] == saved_at
+
+    @responses.activate
+    def test_sdk_login_cached_token_expires(self):
+        """Test that a cached token is not reused past the staleness limit"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/userinfo",
+            json={"result": 0, "auth": "cached_token", "email": "cached@example.com"},
+            status=200,
+        )
+
+        sdk = PCloudSDK(token_manager=False, token_staleness_days=1)
+        sdk.login("cached@example.com", "secret", location_id=2)
+
+        with patch("time.time", return_value=time.time() + 24 * 3600):
+            sdk.login("cached@example.com", "secret", location_id=2)
+
+        assert len(responses.calls) == 2
+
+        # The entry of a lenient instance still expires at a stricter
+        # instance's own limit
+        lenient = PCloudSDK(token_manager=False, token_staleness_days=30)
+        lenient.login("cached@example.com", "secret", location_id=2, force_login=True)
+        strict = PCloudSDK(token_manager=False, token_staleness_days=1)
+        with patch("time.time", return_value=time.time() + 2 * 24 * 3600):
+            strict.login("cached@example.com", "secret", location_id=2)
+
+        assert len(responses.calls) == 4
+
 
 class TestErrorHandling:
     """Tests for various error scenarios"""
@@ -686,7 +891,7 @@ class TestErrorHandling:
         """Test handling of invalid JSON responses"""
         app = App()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "application/json"}
@@ -700,7 +905,7 @@ class TestErrorHandling:
         """Test handling of HTTP error responses"""
         app = App()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_get.return_value = mock_response
@@ -712,7 +917,7 @@ class TestErrorHandling:
         """Test handling of network errors"""
         app = App()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = requests.exceptions.RequestException("Network error")
 
             with pytest.raises(PCloudException):
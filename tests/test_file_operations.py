@@ -3,6 +3,7 @@ Comprehensive file operations tests for pCloud SDK
 Tests upload, download, file manipulation, progress tracking, and error scenarios
 """
 
+import io
 import os
 import tempfile
 from unittest.mock import patch
@@ -13,8 +14,10 @@ from requests.exceptions import ConnectionError, Timeout
 
 from pcloud_sdk import PCloudSDK
 from pcloud_sdk.app import App
+from pcloud_sdk.config import Config
 from pcloud_sdk.exceptions import PCloudException
 from pcloud_sdk.file_operations import File
+from pcloud_sdk.request import MultipartBody
 
 from .test_config import (
     get_test_credentials,
@@ -197,6 +200,167 @@ class TestFileUpload:
         with pytest.raises(PCloudException, match="Invalid file"):
             self.file_ops.upload(self.temp_dir)
 
+    @responses.activate
+    def test_upload_from_file_object(self):
+        """Test upload streamed from an open file object"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_create",
+            json={"result": 0, "uploadid": 12345},
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            "https://eapi.pcloud.com/upload_write",
+            json={"result": 0},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_save",
+            json={
+                "result": 0,
+                "metadata": [{"fileid": 54321, "name": "test_upload.txt"}],
+            },
+            status=200,
+        )
+
+        with open(self.test_file, "rb") as f:
+            result = self.file_ops.upload(f, folder_id=0)
+            assert not f.closed  # Caller keeps ownership of the handle
+
+        assert result["metadata"][0]["name"] == "test_upload.txt"
+        write_request = responses.calls[1].request
+        assert write_request.body == self.test_content
+
+    @responses.activate
+    def test_upload_with_chunk_size(self):
+        """Test chunk_size overrides part_size for one upload"""
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_create",
+            json={"result": 0, "uploadid": 12345},
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            "https://eapi.pcloud.com/upload_write",
+            json={"result": 0},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_save",
+            json={"result": 0, "metadata": [{"fileid": 54321}]},
+            status=200,
+        )
+
+        self.file_ops.upload(self.test_file, folder_id=0, chunk_size=16)
+
+        writes = [
+            c.request.body for c in responses.calls if "upload_write" in c.request.url
+        ]
+        assert [len(body) for body in writes] == [16, 16, 15]
+        assert b"".join(writes) == self.test_content
+        assert self.file_ops.part_size == Config.FILE_PART_SIZE
+
+    def test_upload_file_object_without_name(self):
+        """Test upload of an anonymous file object requires a filename"""
+        with pytest.raises(PCloudException, match="filename"):
+            self.file_ops.upload(io.BytesIO(self.test_content))
+
+    def test_upload_fd_file_object_without_name(self):
+        """Test a file object opened from a descriptor also requires a filename"""
+        with open(os.open(self.test_file, os.O_RDONLY), "rb") as f:
+            with pytest.raises(PCloudException, match="filename"):
+                self.file_ops.upload(f)
+
+    @responses.activate
+    def test_upload_many_single_request(self):
+        """Test several files are uploaded in one multipart request"""
+        second_file = os.path.join(self.temp_dir, "second.txt")
+        with open(second_file, "wb") as f:
+            f.write(b"second file")
+
+        responses.add(
+            responses.POST,
+            "https://eapi.pcloud.com/uploadfile",
+            json={
+                "result": 0,
+                "fileids": [1, 2],
+                "metadata": [
+                    {"fileid": 1, "name": "test_upload.txt"},
+                    {"fileid": 2, "name": "second.txt"},
+                ],
+            },
+            status=200,
+        )
+
+        result = self.file_ops.upload_many([self.test_file, second_file], 123)
+
+        assert result["fileids"] == [1, 2]
+        assert len(responses.calls) == 1
+        body = responses.calls[0].request.body
+        assert b'name="folderid"' in body
+        assert b'filename="test_upload.txt"' in body
+        assert b'filename="second.txt"' in body
+        assert self.test_content in body
+
+    @responses.activate
+    def test_upload_batch_parallel(self):
+        """Test upload_batch uploads every file and keeps the input order"""
+        second_file = os.path.join(self.temp_dir, "second.txt")
+        with open(second_file, "wb") as f:
+            f.write(b"second file")
+
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_create",
+            json={"result": 0, "uploadid": 12345},
+            status=200,
+        )
+        responses.add(
+            responses.PUT,
+            "https://eapi.pcloud.com/upload_write",
+            json={"result": 0},
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/upload_save",
+            json={"result": 0, "metadata": [{"fileid": 1}]},
+            status=200,
+        )
+
+        completed = []
+
+        def progress(*args, **kwargs):
+            if kwargs.get("status") == "completed":
+                completed.append(kwargs["filename"])
+
+        results = self.file_ops.upload_batch(
+            [self.test_file, second_file], max_workers=2, progress_callback=progress
+        )
+
+        assert len(results) == 2
+        assert sorted(completed) == ["second.txt", "test_upload.txt"]
+
+    def test_multipart_body_streams_and_rewinds(self):
+        """Test the streamed multipart body matches its length and can be resent"""
+        body = MultipartBody({"folderid": 0}, [("file1", self.test_file)])
+
+        first = b"".join(body)
+        assert len(first) == len(body)
+        assert first.count(self.test_content) == 1
+
+        body.seek(0)
+        assert body.read() == first
+
+    def test_upload_many_invalid_file(self):
+        """Test upload_many rejects missing files before any request"""
+        with pytest.raises(PCloudException, match="Invalid file"):
+            self.file_ops.upload_many([self.test_file, "/nonexistent/file.txt"])
+
     @responses.activate
     def test_upload_create_session_failure(self):
         """Test handling of upload session creation failure"""
@@ -439,6 +603,38 @@ class TestFileDownload:
             progress_call["operation"] == "download" for progress_call in progress_calls
         )
 
+    @responses.activate
+    def test_download_with_chunk_callback(self):
+        """Test that chunk_callback sees every downloaded byte"""
+        file_id = 12345
+        test_content = b"B" * 1024 * 10
+        chunks = []
+
+        responses.add(
+            responses.GET,
+            "https://eapi.pcloud.com/getfilelink",
+            json={
+                "result": 0,
+                "hosts": ["c123.pcloud.com"],
+                "path": "/cBRFZF7ZTKMDlKfpKv5VIQbNVrBJNIZ0/test_file.txt",
+            },
+            status=200,
+        )
+        responses.add(
+            responses.GET,
+            "https://c123.pcloud.com/cBRFZF7ZTKMDlKfpKv5VIQbNVrBJNIZ0/test_file.txt",
+            body=test_content,
+            headers={"content-length": str(len(test_content))},
+            status=200,
+        )
+
+        success = self.file_ops.download(
+            file_id, self.temp_dir, chunk_callback=chunks.append
+        )
+
+        assert success is True
+        assert b"".join(chunks) == test_content
+
     @responses.activate
     def test_download_failed_get_link(self):
         """Test download failure when getting file link fails"""
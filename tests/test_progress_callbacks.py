@@ -595,6 +595,35 @@ class TestSilentProgress:
         finally:
             os.unlink(temp_log.name)
 
+    def test_silent_progress_buffered_logging(self):
+        """Test SilentProgress with a kept-open buffered log file"""
+        temp_log = tempfile.NamedTemporaryFile(delete=False)
+        temp_log.close()
+
+        try:
+            progress = SilentProgress(log_file=temp_log.name, buffer_size=64 * 1024)
+
+            progress(0, 1024, 0.0, 0.0, filename="test.txt", status="starting")
+            progress(512, 1024, 50.0, 1024.0, filename="test.txt")
+
+            # Progress rows stay in the buffer until the transfer ends
+            with open(temp_log.name, "r", encoding="utf-8") as f:
+                assert "test.txt" not in f.read()
+
+            progress(1024, 1024, 100.0, 1024.0, filename="test.txt", status="completed")
+
+            with open(temp_log.name, "r", encoding="utf-8") as f:
+                data_lines = [line for line in f if not line.startswith("#")]
+            assert len(data_lines) == 3
+            assert data_lines[-1].strip().endswith(",completed")
+
+            progress.close()
+            progress.close()  # idempotent
+            assert progress._handle is None
+
+        finally:
+            os.unlink(temp_log.name)
+
     def test_silent_progress_log_file_error_handling(self):
         """Test SilentProgress handling of log file errors"""
         # Use invalid log file path
@@ -614,6 +643,20 @@ class TestProgressFactoryFunctions:
         assert progress.width == 40
         assert progress.show_speed is False
 
+    def test_create_progress_bar_aggregates_small_updates(self):
+        """Test that factory progress bars redraw at most every 256KB"""
+        progress = create_progress_bar("Test Upload")
+        total = 1024 * 1024
+        assert progress.min_bytes == 256 * 1024
+
+        with patch("builtins.print") as mock_print:
+            progress(0, total, 0.0, 0.0, filename="test.txt")
+            for transferred in range(8192, 256 * 1024, 8192):
+                progress(transferred, total, transferred / total * 100, 1024.0)
+
+        # Only the title line is printed, the 8KB updates are aggregated
+        assert mock_print.call_count == 1
+
     def test_create_detailed_progress_factory(self):
         """Test create_detailed_progress factory function"""
         temp_log = tempfile.NamedTemporaryFile(delete=False)
@@ -949,6 +992,18 @@ class TestProgressPerformance:
         finally:
             os.unlink(temp_log.name)
 
+    def test_detailed_progress_max_checkpoints(self):
+        """Test that max_checkpoints keeps only the most recent checkpoints"""
+        progress = DetailedProgress(max_checkpoints=100)
+
+        with patch("builtins.print"):
+            for i in range(1000):
+                progress(i, 1000, i / 10.0, 1024.0, filename="test.txt")
+
+        assert len(progress.checkpoints) == 100
+        assert progress.checkpoints[0]["bytes"] == 900
+        assert progress.checkpoints[-1]["bytes"] == 999
+
     def test_memory_usage_with_many_callbacks(self):
         """Test memory usage doesn't grow excessively with many callback calls"""
         import gc
@@ -76,6 +76,23 @@ class TestTokenSavingAndLoading:
         assert saved_data["user_info"] == test_credentials["user_info"]
         assert "saved_at" in saved_data
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_save_credentials_owner_only(self):
+        """Test credentials are written owner-only without a leftover temp file"""
+        with open(self.token_file, "w") as f:
+            f.write("{}")
+        os.chmod(self.token_file, 0o644)
+
+        sdk = PCloudSDK(token_file=self.token_file)
+        sdk._save_credentials(
+            email="test@example.com", token="test_token_123", location_id=2
+        )
+
+        assert os.stat(self.token_file).st_mode & 0o777 == 0o600
+        assert not os.path.exists(self.token_file + ".tmp")
+        with open(self.token_file, "r") as f:
+            assert json.load(f)["access_token"] == "test_token_123"
+
     def test_save_credentials_with_oauth2(self):
         """Test saving OAuth2 credentials"""
         sdk = PCloudSDK(token_file=self.token_file, auth_type="oauth2")